@@ -0,0 +1,148 @@
+"""
+DA-AI Time-Series Analytics
+=========================================================
+Growth metrics derived from the long fin / usr frames instead of typed in:
+
+    a = analytics.for_dataset(d)
+    a.value("rev_yoy", "OpenAI", 2025)          → 251.4
+    a.pivot("rev_yoy")                          → year × company table
+    a.append(new_rows)                          → recomputes only the tail
+
+Derived columns, per company, for every measure in `measures`:
+
+    <m>_yoy         % change vs one year earlier (per_year periods back)
+    <m>_cagr<n>     compound annual growth over n years, %
+    <m>_roll<w>     trailing mean of the last w reported periods
+    burn_mult       burn / net new ARR over the last period
+
+All of them are grouped shifts and cumulative sums over a frame kept in time
+order (period, then company), and a lag is only taken when the earlier period
+is exactly the expected distance away, so a gap (a company launching late,
+a missed quarter) yields NaN instead of a mismatched ratio.
+
+Because the frame is time-ordered, new periods land at the end: append()
+recomputes only the rows within the longest lookback of the first new period
+and leaves the history untouched. A restatement (rows at or before the last
+period already held) falls back to a full recompute.
+"""
+
+import numpy as np
+import pandas as pd
+
+from data_store import VersionCache
+from schema import to_float64
+
+MEASURES = ("rev", "arr", "mau")
+
+
+class Analytics:
+    def __init__(self, frame, measures=MEASURES, per_year=1, cagr_years=(3,), window=3, derived=False):
+        """derived=True: `frame` is an earlier Analytics' .frame (snapshot.py), kept as is."""
+        self.measures = [m for m in measures if m in frame]
+        self.raw = ["company", "period"] + self.measures + [m for m in ("burn",) if m in frame]
+        self.per_year, self.cagr_years, self.window = per_year, tuple(cagr_years), window
+        # Periods needed before a row to derive it.
+        self.lookback = max([per_year, window - 1, 1] + [n * per_year for n in self.cagr_years])
+        self.frame = frame.reset_index(drop=True) if derived else self._derive(self._prepare(frame))
+        self.recomputed = 0 if derived else len(self.frame)
+
+    def _prepare(self, frame):
+        """The raw columns as str / int64 / float64, in time order."""
+        if "period" not in frame:
+            frame = frame.assign(period=frame["year"])
+        out = pd.DataFrame({"company": frame["company"].astype(str).to_numpy(),
+                            "period": frame["period"].to_numpy(dtype=np.int64)})
+        for m in self.raw[2:]:
+            out[m] = to_float64(frame[m]) if m in frame else np.nan
+        return out.sort_values(["period", "company"], kind="stable").reset_index(drop=True)
+
+    def _lagged(self, df, g, col, lag):
+        """col `lag` periods back within each company, NaN across gaps."""
+        prev = g[col].shift(lag)
+        ok = (df["period"] - g["period"].shift(lag)) == lag   # lag rows back is lag periods back
+        # Data is dense per company in practice; a gap breaks the row/period
+        # correspondence, so fall back to an exact merge for those rows.
+        if not ok.all():
+            back = df[["company", "period", col]].assign(period=df["period"] + lag)
+            prev = df[["company", "period"]].merge(back, on=["company", "period"], how="left")[col]
+            prev.index = df.index
+        return prev
+
+    def _derive(self, df):
+        g = df.groupby("company", sort=False)
+        out = df.copy()
+        for m in self.measures:
+            v = df[m]
+            out[f"{m}_yoy"] = (v / self._lagged(df, g, m, self.per_year) - 1) * 100
+            for n in self.cagr_years:
+                base = self._lagged(df, g, m, n * self.per_year)
+                out[f"{m}_cagr{n}"] = ((v / base) ** (1 / n) - 1) * 100
+            filled = v.fillna(0)
+            csum = filled.groupby(df["company"], sort=False).cumsum()
+            count = v.notna().astype(int).groupby(df["company"], sort=False).cumsum()
+            w = self.window
+            prev_sum = csum.groupby(df["company"], sort=False).shift(w).fillna(0)
+            prev_cnt = count.groupby(df["company"], sort=False).shift(w).fillna(0)
+            n_obs = count - prev_cnt
+            out[f"{m}_roll{w}"] = ((csum - prev_sum) / n_obs).where(n_obs == w)
+        if "burn" in df and "arr" in df:
+            net_new = df["arr"] - self._lagged(df, g, "arr", 1)
+            out["burn_mult"] = (df["burn"] / net_new).where(net_new > 0)
+        return out
+
+    # ── incremental updates ───────────────────────────────────────────────────
+    def append(self, rows):
+        """Add or replace periods; returns the number of rows recomputed."""
+        new = self._prepare(rows)
+        if new.empty:
+            return 0
+        first = int(new["period"].min())
+        last = int(self.frame["period"].max()) if len(self.frame) else first - 1
+        base = self.frame[self.raw]
+        if first <= last:
+            # Restatement or backfill: replace matching keys, rebuild everything.
+            keys = pd.MultiIndex.from_frame(new[["company", "period"]])
+            keep = ~pd.MultiIndex.from_frame(base[["company", "period"]]).isin(keys)
+            merged = pd.concat([base[keep], new], ignore_index=True)
+            self.frame = self._derive(merged.sort_values(["period", "company"], kind="stable")
+                                      .reset_index(drop=True))
+            self.recomputed = len(self.frame)
+            return self.recomputed
+        merged = pd.concat([base, new], ignore_index=True)
+        start = int(np.searchsorted(merged["period"].to_numpy(), first - self.lookback))
+        tail = self._derive(merged.iloc[start:].reset_index(drop=True))
+        fresh = tail[tail["period"] >= first]
+        self.frame = pd.concat([self.frame, fresh], ignore_index=True)
+        self.recomputed = len(tail)
+        return self.recomputed
+
+    # ── lookups ───────────────────────────────────────────────────────────────
+    def pivot(self, column):
+        """period × company table of one column (rows with no value dropped)."""
+        t = self.frame.pivot(index="period", columns="company", values=column)
+        return t.dropna(how="all")
+
+    def value(self, column, company, period):
+        hit = self.frame.loc[(self.frame["company"] == company) & (self.frame["period"] == period), column]
+        return float(hit.iloc[0]) if len(hit) else np.nan
+
+
+def dataset_frame(d, upto=2025):
+    """fin + usr history (no projections) joined on company and year."""
+    keys = ["company", "year"]
+    fin = d.fin[[c for c in ["company", "year", "rev", "arr", "burn"] if c in d.fin]]
+    usr = d.usr[[c for c in ["company", "year", "mau"] if c in d.usr]]
+    df = fin.merge(usr, on=keys, how="outer")
+    return df[df["year"] <= upto]
+
+
+# ── PER-DATASET CACHE ──────────────────────────────────────────────────────────
+_analytics = VersionCache()
+
+def for_dataset(d):
+    """The Analytics of `d`'s history, built once per dataset version."""
+    return _analytics.get(d.version, lambda: Analytics(dataset_frame(d)))
+
+def prime(d, a):
+    """Install a precomputed Analytics for `d` (snapshot.py)."""
+    return _analytics.put(d.version, a)
@@ -0,0 +1,363 @@
+"""
+DA-AI Aggregation API
+=========================================================
+Pre-aggregated JSON slices of the shared data layer (shared_store.py) for the
+static index.html dashboard, so the page no longer inlines every table:
+
+    python api_server.py                    # http://127.0.0.1:8765/
+    python api_server.py 9000
+
+    GET /                                   index.html
+    GET /api/meta                           dataset version, companies, years
+    GET /api/dashboard?companies=&year=     every table index.html renders + KPIs
+    GET /api/kpis?companies=                header KPIs only
+    GET /api/series?measure=arr&companies=&year=
+    GET /api/tools?cat=&co=&min_score=&weights=perf:2,cost:1,ease:1&by=score&k=10
+    GET /api/rankings?companies=&year=      champions, composite scores and ranks (default 2025)
+
+Without an API (a static host such as GitHub Pages, or `python -m
+http.server`) index.html falls back to dashboard.json next to it:
+static_dashboard() as written by `python snapshot.py`. Opened from file://
+it has no data, since browsers block fetch() there.
+
+Every /api/ endpoint also takes `version=` to read one of the last few dataset
+versions it served (404 once that version is gone), so a client can keep a
+page consistent across a hot reload.
+
+`companies` is a comma-separated list of canonical names (default: all);
+`year` limits the per-year series to that year (the dashboard slice keeps
+2025 too, which its scorecards read). Responses are compressed with brotli
+(when the module is installed) or gzip per Accept-Encoding and carry a
+strong ETag per representation: a hash of the JSON body, suffixed with the
+coding ("<hash>-gzip") when compressed. If-None-Match is compared on the
+hash alone, so a client revalidating any coding of an unchanged body gets
+a 304. Bodies and their encodings are memoized per (dataset version,
+normalized query), so repeat requests never re-serialize.
+"""
+
+import functools
+import gzip
+import hashlib
+import itertools
+import json
+import math
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import analytics
+import rankings
+import shared_store
+import tool_index
+from charts import SEGMENTS
+from data_store import VersionCache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT   = Path(__file__).resolve().parent
+INDEX  = ROOT / "index.html"
+STATIC = ROOT / "dashboard.json"
+STATIC_SUBSETS = 8      # company counts up to this get every subset precomputed
+
+# Model benchmarks shown on the AI Models page (formerly inlined in index.html).
+BENCHMARKS = {
+    "Claude 3.5 Sonnet": {"company":"Anthropic","mmlu":88.7,"code":92.0,"math":78.3,"overall":88.7},
+    "GPT-4o":            {"company":"OpenAI","mmlu":88.0,"code":90.2,"math":76.6,"overall":87.8},
+    "Gemini 2.0 Flash":  {"company":"Google (Gemini)","mmlu":86.9,"code":88.3,"math":74.0,"overall":85.6},
+    "Grok 2":            {"company":"xAI (Grok)","mmlu":87.5,"code":88.0,"math":76.1,"overall":84.9},
+    "Llama 4 70B":       {"company":"Meta (Llama)","mmlu":86.0,"code":84.2,"math":68.0,"overall":82.3},
+}
+PERIODS = ((2022, 2023), (2023, 2024), (2024, 2025))
+
+
+class BadRequest(ValueError):
+    pass
+
+
+class Gone(LookupError):
+    """The requested dataset version is no longer pinned."""
+
+
+# ── SLICES ─────────────────────────────────────────────────────────────────────
+def _num(v, nd=None):
+    if v is None or (isinstance(v, float) and math.isnan(v)):
+        return None
+    v = float(v)
+    return round(v, nd) if nd is not None else (int(v) if v.is_integer() else v)
+
+
+def _by_year(cube, measure, cos, year=None, upto=2025, keep=2025):
+    # `keep` survives the year filter: the comparison and ranking pages always
+    # score companies on 2025, whatever year the charts are showing.
+    out = {}
+    for c in cos:
+        yrs, v = cube.present(measure, c)
+        row = {str(y): _num(x) for y, x in zip(yrs, v) if y <= upto and (year is None or y in (year, keep))}
+        if row:
+            out[c] = row
+    return out
+
+
+def _at(cube, measure, cos, year=2025, nd=None):
+    return {c: v for c in cos if (v := _num(cube.value(measure, c, year), nd)) is not None}
+
+
+def _yoy(growth, c, year):
+    v = growth.value("rev_yoy", c, year)
+    return None if math.isnan(v) else round(v)
+
+
+def series(d, measure, cos, year=None):
+    if measure not in d.cube.measures:
+        raise BadRequest(f"unknown measure {measure!r}")
+    return {"measure": measure, "values": _by_year(d.cube, measure, cos, year, upto=9999, keep=year)}
+
+
+def tools(d, cat=None, co=None, min_scores=(), weights=(), by="score", k=10):
+    """Top-k rows of the tool ranking (tool_index.py) for one normalized query."""
+    idx = tool_index.for_dataset(d)
+    try:
+        top = idx.query(cat, co, dict(min_scores), dict(weights), by, k)
+    except (KeyError, ValueError) as e:
+        raise BadRequest(e.args[0]) from None
+    return {"version": d.version, "total": len(idx),
+            "tools": [{col: _num(v, 4) if isinstance(v, float) else v for col, v in row.items()}
+                      for row in top.to_dict("records")]}
+
+
+def ranking(d, cos, year=None):
+    """Champions and the composite / rank-score board of `cos` (rankings.py)."""
+    r, year = rankings.for_dataset(d), year or rankings.YEAR
+    board = r.board(cos, year)
+    return {"version": d.version, "year": year, "champions": r.champions(cos, year),
+            "board": [{k: _num(v, 2) if isinstance(v, float) else v for k, v in row.items()}
+                      for row in board.to_dict("records")]}
+
+
+def kpis(d, cos):
+    """Inputs of index.html's header KPI row, aggregated over `cos`."""
+    cube = d.cube
+    total = lambda m: sum(_at(cube, m, cos).values())
+    ltv = _at(cube, "ltvcac", cos)
+    best = max(ltv, key=ltv.get) if ltv else None
+    margins = _at(cube, "margin", cos)      # only companies that report a 2025 margin
+    return {
+        "companies": len(cos),
+        "total_arr": total("arr"),
+        "avg_margin": sum(margins.values()) / len(margins) if margins else None,
+        "total_mau": total("mau"),
+        "total_share": total("share"),
+        "best_ltvcac": ltv.get(best), "best_ltvcac_co": best,
+        "total_val": total("val"),
+    }
+
+
+def dashboard(d, cos, year=None):
+    """Every table index.html renders, keyed the way its charts read them."""
+    cube = d.cube
+    arr25, val25 = _at(cube, "arr", cos), _at(cube, "val", cos)
+    growth = analytics.for_dataset(d)
+    ranks = ranking(d, cos)
+    seg = {c: {"c": s["consumer"], "e": s["enterprise"], "a": s["api"]}
+           for s in SEGMENTS for c in cos if c.split(" ")[0] == s["co"]}
+    return {
+        "version":  d.version,
+        "companies": list(cos),
+        "year":     year,
+        "kpis":     kpis(d, cos),
+        "ARR":      _by_year(cube, "arr", cos, year),
+        "MARGIN":   _by_year(cube, "margin", cos, year),
+        "ARPU_D":   _by_year(cube, "arpu", cos, year),
+        "MAU":      _at(cube, "mau", cos),
+        "SHARE":    _at(cube, "share", cos),
+        "ARR25":    arr25,
+        "VAL25":    val25,
+        "GROWTH":   {c: [_yoy(growth, c, b) for _, b in PERIODS] for c in cos},
+        "LTVCAC":   _at(cube, "ltvcac", cos),
+        "PROJ":     {c: [arr25.get(c)] + [_num(cube.value("base", c, y)) for y in (2026, 2028, 2030)] for c in cos},
+        "BULL":     _at(cube, "bull", cos, 2030),
+        "BASE":     _at(cube, "base", cos, 2030),
+        "BEAR":     _at(cube, "bear", cos, 2030),
+        "VAL_MULT": {c: round(val25[c] / arr25[c], 1) for c in cos if arr25.get(c) and c in val25},
+        "SEG":      seg,
+        "BENCHMARKS": {k: b for k, b in BENCHMARKS.items() if b["company"] in cos},
+        # Scored on 2025 like the comparison / ranking pages (see _by_year).
+        "RANKINGS": ranks["champions"],
+        "SCORES":   {row["company"]: row for row in ranks["board"]},
+    }
+
+
+def static_dashboard(d):
+    """index.html's data without the API: the all-companies, all-years slice
+    plus, per company subset (key: sorted names), the parts that depend on the
+    subset as a whole (KPIs, champions, scores). The page filters the per-company
+    tables and years itself."""
+    everyone = tuple(d.cube.companies)
+    subsets = {}
+    if len(everyone) <= STATIC_SUBSETS:
+        for n in range(1, len(everyone) + 1):
+            for cos in itertools.combinations(everyone, n):
+                r = ranking(d, cos)
+                subsets[",".join(sorted(cos))] = {"kpis": kpis(d, cos), "RANKINGS": r["champions"],
+                                                  "SCORES": {row["company"]: row for row in r["board"]}}
+    return {"version": d.version, "full": dashboard(d, everyone), "subsets": subsets}
+
+
+# ── QUERY PARSING ──────────────────────────────────────────────────────────────
+def parse_companies(raw, known):
+    if not raw:
+        return tuple(known)
+    picked = {c.strip() for c in raw.split(",") if c.strip()}
+    unknown = picked - set(known)
+    if unknown:
+        raise BadRequest(f"unknown companies: {', '.join(sorted(unknown))}")
+    return tuple(c for c in known if c in picked)
+
+
+def parse_year(raw, years):
+    if raw in (None, "", "all"):
+        return None
+    try:
+        year = int(raw)
+    except ValueError:
+        raise BadRequest(f"bad year {raw!r}") from None
+    if year not in {int(y) for y in years}:
+        raise BadRequest(f"no data for year {year}")
+    return year
+
+
+def parse_tools(q):
+    """Normalized, hashable tool query: (cat, co, min_scores, weights, by, k)."""
+    split = lambda raw: tuple(sorted({v.strip() for v in raw.split(",") if v.strip()})) if raw else None
+    try:
+        min_scores = tuple((m, float(q[f"min_{m}"])) for m in tool_index.METRICS if q.get(f"min_{m}"))
+        weights = tuple(sorted((m, float(w)) for m, _, w in
+                               (p.partition(":") for p in q.get("weights", "").split(",") if p)))
+        k = min(int(q.get("k", 10)), 1000)
+    except ValueError:
+        raise BadRequest("min_* and weights need numbers, k an integer") from None
+    if k < 1:
+        raise BadRequest("k must be at least 1")
+    return split(q.get("cat")), split(q.get("co")), min_scores, weights, q.get("by", "score"), k
+
+
+# ── RESPONSES ──────────────────────────────────────────────────────────────────
+# Snapshots by version, so a memoized body is always built from the snapshot
+# its request saw even if the shared store swaps mid-request.
+_snapshots = VersionCache(keep=4)
+
+@functools.lru_cache(maxsize=512)
+def _body(version, endpoint, cos, year, opts):
+    """(etag, JSON bytes) for one normalized query; version keys the cache.
+    `opts` carries the endpoint's own parameters (measure, tool query)."""
+    d = _snapshots.get(version)
+    if d is None:
+        raise Gone(version)
+    if endpoint == "meta":
+        obj = {"version": d.version, "companies": list(d.cube.companies),
+               "years": [int(y) for y in d.cube.years], "measures": list(d.cube.measures)}
+    elif endpoint == "kpis":
+        obj = kpis(d, cos)
+    elif endpoint == "series":
+        obj = series(d, opts, cos, year)
+    elif endpoint == "tools":
+        obj = tools(d, *opts)
+    elif endpoint == "rankings":
+        obj = ranking(d, cos, year)
+    else:
+        obj = dashboard(d, cos, year)
+    raw = json.dumps(obj, separators=(",", ":")).encode()
+    return '"' + hashlib.blake2b(raw, digest_size=12).hexdigest() + '"', raw
+
+
+@functools.lru_cache(maxsize=512)
+def _encoded(version, endpoint, cos, year, opts, encoding):
+    """(etag, body) in `encoding`; the ETag names the coding, since a strong
+    validator must only match byte-identical bodies."""
+    etag, raw = _body(version, endpoint, cos, year, opts)
+    if encoding == "br":
+        return etag[:-1] + '-br"', brotli.compress(raw, quality=9)
+    if encoding == "gzip":
+        return etag[:-1] + '-gzip"', gzip.compress(raw, compresslevel=6, mtime=0)
+    return etag, raw
+
+
+def _etag_hash(tag):
+    """The body hash of an ETag, without W/ or the -<coding> suffix."""
+    return tag.strip().removeprefix("W/").strip('"').split("-")[0]
+
+
+def negotiate(accept):
+    accepted = {p.split(";")[0].strip() for p in (accept or "").split(",")}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    return "gzip" if "gzip" in accepted else "identity"
+
+
+class Handler(BaseHTTPRequestHandler):
+    ENDPOINTS = ("meta", "dashboard", "kpis", "series", "tools", "rankings")
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path in ("/", "/index.html"):
+            return self._send(200, INDEX.read_bytes(), "text/html; charset=utf-8")
+        endpoint = url.path.removeprefix("/api/")
+        if not url.path.startswith("/api/") or endpoint not in self.ENDPOINTS:
+            return self._error(404, f"no such endpoint {url.path}")
+        q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        d = shared_store.default().current()     # one snapshot per request
+        if q.get("version") and q["version"] != d.version:
+            d = _snapshots.get(q["version"])
+            if d is None:
+                return self._error(404, f"dataset version {q['version']} is not available")
+        _snapshots.get(d.version, lambda: d)
+        try:
+            cos = parse_companies(q.get("companies"), d.cube.companies)
+            year = parse_year(q.get("year"), d.cube.years)
+            opts = (q.get("measure", "arr") if endpoint == "series" else
+                    parse_tools(q) if endpoint == "tools" else None)
+        except BadRequest as e:
+            return self._error(400, str(e))
+        encoding = negotiate(self.headers.get("Accept-Encoding"))
+        try:
+            etag, body = _encoded(d.version, endpoint, cos, year, opts, encoding)
+        except BadRequest as e:
+            return self._error(400, str(e))
+        except Gone:
+            return self._error(409, f"dataset version {d.version} was replaced during the request; retry")
+        if _etag_hash(etag) in {_etag_hash(t) for t in self.headers.get("If-None-Match", "").split(",")}:
+            return self._send(304, b"", etag=etag)
+        self._send(200, body, "application/json", etag=etag, encoding=encoding)
+
+    def _error(self, code, message):
+        self._send(code, json.dumps({"error": message}).encode(), "application/json")
+
+    def _send(self, code, body, ctype=None, etag=None, encoding="identity"):
+        self.send_response(code)
+        if ctype:
+            self.send_header("Content-Type", ctype)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if encoding != "identity":
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port=8765, host="127.0.0.1"):
+    print(f"serving index.html and /api/* on http://{host}:{port}/")
+    ThreadingHTTPServer((host, port), Handler).serve_forever()
+
+
+if __name__ == "__main__":
+    serve(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,293 @@
+"""
+DA-AI Load Benchmark
+=========================================================
+Concurrent-session load test of the Streamlit app, over the same WebSocket
+protocol the browser speaks:
+
+    python bench_load.py                                # 1, 5, 10, 25 sessions
+    python bench_load.py --sessions 1,10,50 --actions 30 --think 0.5
+    python bench_load.py --url http://host:8501         # an already running server
+    python bench_load.py --baseline old_load.json       # fail on >25% regressions
+
+Unless --url is given it launches `streamlit run streamlit_app.py` headless
+on a free port and stops it afterwards. After one untimed warm-up session, for
+each session count it opens that many sessions at once; each one runs the
+script, then performs --actions random interactions (switch the view radio,
+or pick a new company subset in the sidebar multiselect) with --think seconds
+of jittered pause between them, sending the rerun with the full widget state
+exactly as the frontend does.
+
+A rerun's latency is the time from sending the BackMsg to the server's
+script_finished ForwardMsg, so it covers queueing, the script run and every
+delta sent back. While a level runs the server process is sampled from
+/proc: peak RSS and the CPU time it used (Linux only; null elsewhere).
+
+Per session count the JSON report (load_report.json by default) records
+rerun p50/p95/p99/max, reruns/s, errors, first-run latency, peak RSS and
+CPU (% of one core, and ms per rerun), and RSS growth per session over the
+idle server. --baseline compares p95, peak RSS and CPU per rerun against an
+earlier report with the same session counts.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = Path(__file__).resolve().parent
+VIEW, COMPANIES = "View", "Companies"       # widget labels the sessions drive
+
+
+# ── SERVER ─────────────────────────────────────────────────────────────────────
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, timeout=60):
+    """`streamlit run streamlit_app.py` on `port`, once its health check answers.
+
+    Server output goes to a temporary file: an unread pipe fills up under load
+    and blocks the server on its next log line.
+    """
+    log = tempfile.TemporaryFile("w+")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(ROOT / "streamlit_app.py"),
+         "--server.headless", "true", "--server.port", str(port), "--server.address", "127.0.0.1",
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=log, stderr=subprocess.STDOUT, text=True)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            log.seek(0)
+            raise RuntimeError(f"streamlit exited with {proc.returncode}: {log.read()[-2000:]}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"streamlit did not become healthy within {timeout}s")
+
+
+class ProcSampler:
+    """Peak RSS and CPU seconds of one process, read from /proc (None where absent)."""
+
+    TICK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.ok = pid is not None and Path(f"/proc/{pid}/stat").exists()
+
+    def rss_mb(self):
+        for line in Path(f"/proc/{self.pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+        return 0.0
+
+    def cpu_s(self):
+        fields = Path(f"/proc/{self.pid}/stat").read_text().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self.TICK      # utime + stime
+
+    async def watch(self, stop, every=0.2):
+        """Sample RSS until `stop` is set; returns the peak in MB."""
+        peak = self.rss_mb()
+        while not stop.is_set():
+            await asyncio.sleep(every)
+            peak = max(peak, self.rss_mb())
+        return peak
+
+
+# ── SESSIONS ───────────────────────────────────────────────────────────────────
+class Session:
+    """One simulated browser tab on the app's WebSocket stream."""
+
+    def __init__(self, ws, timeout):
+        self.ws, self.timeout = ws, timeout
+        self.widgets = {}           # label → (id, options)
+        self.state = {}             # id → (WidgetState field, value)
+
+    async def rerun(self):
+        """Send a rerun with the current widget state; (latency s, ok) at script_finished."""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        for wid, (field, value) in self.state.items():
+            w = msg.rerun_script.widget_states.widgets.add()
+            w.id = wid
+            if field == "string_array_value":
+                w.string_array_value.data.extend(value)
+            else:
+                setattr(w, field, value)
+        t0 = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        ok = True
+        async with asyncio.timeout(self.timeout):
+            while True:
+                fwd = ForwardMsg()
+                fwd.ParseFromString(await self.ws.recv())
+                kind = fwd.WhichOneof("type")
+                if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                    el = fwd.delta.new_element
+                    sub = getattr(el, el.WhichOneof("type"))
+                    ok &= el.WhichOneof("type") != "exception"
+                    fields = sub.DESCRIPTOR.fields_by_name
+                    if "id" in fields and "label" in fields and "options" in fields:
+                        self.widgets[sub.label] = (sub.id, list(sub.options))
+                elif kind == "script_finished":
+                    if fwd.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                        continue
+                    return time.perf_counter() - t0, ok and fwd.script_finished == ForwardMsg.FINISHED_SUCCESSFULLY
+
+    def act(self, rng):
+        """Pick the next interaction: a different view, or a new company subset."""
+        if rng.random() < 0.5 and VIEW in self.widgets:
+            wid, views = self.widgets[VIEW]
+            current = self.state.get(wid, (None, views[0]))[1]
+            self.state[wid] = ("string_value", rng.choice([v for v in views if v != current] or views))
+        elif COMPANIES in self.widgets:
+            wid, cos = self.widgets[COMPANIES]
+            self.state[wid] = ("string_array_value", rng.sample(cos, rng.randint(1, len(cos))))
+
+
+async def session(url, actions, think, seed, timeout, out):
+    rng = random.Random(seed)
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None,
+                                  open_timeout=timeout) as ws:
+        s = Session(ws, timeout)
+        first, ok = await s.rerun()
+        out["first"].append(first)
+        out["errors"] += not ok
+        for _ in range(actions):
+            await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+            s.act(rng)
+            t, ok = await s.rerun()
+            out["reruns"].append(t)
+            out["errors"] += not ok
+
+
+async def run_level(url, n, actions, think, seed, timeout, sampler, idle_mb=None):
+    """n concurrent sessions; latency percentiles plus server RSS / CPU while they ran."""
+    out = {"first": [], "reruns": [], "errors": 0}
+    stop = asyncio.Event()
+    watch = asyncio.create_task(sampler.watch(stop)) if sampler.ok else None
+    cpu0, t0 = sampler.cpu_s() if sampler.ok else None, time.perf_counter()
+    results = await asyncio.gather(*(session(url, actions, think, seed * 10_000 + i, timeout, out)
+                                     for i in range(n)), return_exceptions=True)
+    wall = time.perf_counter() - t0
+    cpu = sampler.cpu_s() - cpu0 if sampler.ok else None
+    stop.set()
+    peak = await watch if watch else None
+    failed = [r for r in results if isinstance(r, BaseException)]
+    ms = np.asarray(out["reruns"]) * 1000
+    pct = lambda q: round(float(np.percentile(ms, q)), 1) if len(ms) else None
+    return {
+        "sessions":       n,
+        "reruns":         len(ms),
+        "errors":         out["errors"] + len(failed),
+        "failures":       sorted({f"{type(e).__name__}: {e}" for e in failed})[:5],
+        "p50_ms":         pct(50),
+        "p95_ms":         pct(95),
+        "p99_ms":         pct(99),
+        "max_ms":         round(float(ms.max()), 1) if len(ms) else None,
+        "first_p50_ms":   round(float(np.median(out["first"])) * 1000, 1) if out["first"] else None,
+        "reruns_per_s":   round(len(ms) / wall, 2),
+        "wall_s":         round(wall, 2),
+        "rss_mb":         round(peak, 1) if peak is not None else None,
+        "rss_per_session_mb": round((peak - idle_mb) / n, 2) if peak is not None and idle_mb else None,
+        "cpu_pct":        round(cpu / wall * 100, 1) if cpu is not None else None,
+        "cpu_ms_per_rerun": round(cpu * 1000 / max(1, len(ms) + len(out["first"])), 1) if cpu is not None else None,
+    }
+
+
+# ── BASELINE ───────────────────────────────────────────────────────────────────
+def check(report, baseline=None, tolerance=0.25):
+    failures = []
+    old = {str(r["sessions"]): r for r in (baseline or {}).get("levels", [])}
+    for r in report["levels"]:
+        if r["errors"]:
+            failures.append(f"{r['sessions']} sessions: {r['errors']} failed reruns")
+        prev = old.get(str(r["sessions"]))
+        for metric in ("p95_ms", "rss_mb", "cpu_ms_per_rerun") if prev else ():
+            if r[metric] and prev.get(metric) and r[metric] > prev[metric] * (1 + tolerance):
+                failures.append(f"{r['sessions']} sessions: {metric}={r[metric]} vs baseline "
+                                f"{prev[metric]} (+{tolerance:.0%})")
+    return failures
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sessions", default="1,5,10,25", help="comma-separated concurrent session counts")
+    ap.add_argument("--actions", type=int, default=20, help="interactions per session after the first run")
+    ap.add_argument("--think", type=float, default=0.5, help="mean pause between interactions, seconds")
+    ap.add_argument("--timeout", type=float, default=120, help="per-rerun timeout, seconds")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--url", help="an already running app (default: launch one)")
+    ap.add_argument("--baseline", help="earlier report to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    ap.add_argument("--out", default="load_report.json")
+    args = ap.parse_args(argv)
+
+    proc = None
+    if args.url:
+        base = args.url.rstrip("/")
+    else:
+        port = free_port()
+        proc = start_server(port)
+        base = f"http://127.0.0.1:{port}"
+    url = base.replace("http", "ws", 1) + "/_stcore/stream"
+    sampler = ProcSampler(proc.pid if proc else None)
+    report = {
+        "python":   platform.python_version(),
+        "platform": platform.platform(),
+        "cpus":     os.cpu_count(),
+        "config":   {k: getattr(args, k) for k in ("actions", "think", "seed")},
+        "levels":   [],
+    }
+    try:
+        # One untimed session first, so imports, data load and the process-wide
+        # caches are warm and idle RSS is the server as every level finds it.
+        warm = asyncio.run(run_level(url, 1, 0, 0, args.seed, args.timeout, sampler))
+        report["cold_first_ms"] = warm["first_p50_ms"]
+        report["idle_rss_mb"] = round(sampler.rss_mb(), 1) if sampler.ok else None
+        for n in map(int, args.sessions.split(",")):
+            r = asyncio.run(run_level(url, n, args.actions, args.think, args.seed, args.timeout,
+                                      sampler, report["idle_rss_mb"]))
+            report["levels"].append(r)
+            print(f"{n:>4} sessions  p50 {r['p50_ms']} ms  p95 {r['p95_ms']} ms  p99 {r['p99_ms']} ms  "
+                  f"{r['reruns_per_s']} reruns/s  rss {r['rss_mb']} MB  cpu {r['cpu_pct']}%  "
+                  f"errors {r['errors']}")
+    finally:
+        if proc:
+            proc.terminate()
+            try:
+                proc.wait(10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    Path(args.out).write_text(json.dumps(report, indent=2))
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    failures = check(report, baseline, args.tolerance)
+    for f in failures:
+        print("FAIL", f)
+    print(f"report → {args.out}  ({len(failures)} failures)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
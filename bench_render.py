@@ -0,0 +1,266 @@
+"""
+DA-AI Rendering Benchmark
+=========================================================
+Headless timing of every chart builder in charts.py across synthetic
+universes, checked against bench_budgets.json:
+
+    python bench_render.py                              # default matrix
+    python bench_render.py --companies 5,50 --periods 4,12
+    python bench_render.py --apptest                    # + full reruns per view
+    python bench_render.py --startup                    # + cold-start import profile
+    python bench_render.py --baseline old_report.json   # fail on >25% regressions
+
+For every (companies × periods) dataset and every chart it records the cold
+build time (median of --repeat builds, each on a fresh dataset version so
+every version-keyed cache misses), the warm rebuild time (best of --repeat
+on a version already built), serialized figure bytes and peak traced memory
+of a cold build,
+writes a JSON report (bench_report.json by default) and exits 1 if any
+budget or baseline comparison regresses. --startup adds a cold-start
+profile: `python -X importtime` over streamlit_app.py's top-level imports
+in a fresh interpreter, with the slowest modules, then the time to load the
+dataset and build the first view's charts.
+"""
+
+import argparse
+import ast
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import charts
+from data_store import Dataset, seed_frames
+from metric_cube import MetricCube
+
+ROOT    = Path(__file__).resolve().parent
+BUDGETS = ROOT / "bench_budgets.json"
+
+
+# ── SYNTHETIC DATA ─────────────────────────────────────────────────────────────
+def synthetic_dataset(n_companies, n_periods, seed=0):
+    """A Dataset shaped like the real one: the Big Five first, then V### vendors.
+
+    History covers the `n_periods` years ending 2025 and projections cover
+    2026–2030, so every builder's hard-coded 2025/2030 snapshots still hit.
+    """
+    rng = np.random.default_rng(seed)
+    cos = (charts.COMPANIES + [f"V{i:03d} Labs" for i in range(n_companies)])[:n_companies]
+    years = np.arange(2026 - n_periods, 2026)
+    n = len(cos) * len(years)
+    company = np.repeat(cos, len(years))
+    year = np.tile(years, len(cos))
+
+    growth = rng.lognormal(0.4, 0.5, size=(len(cos), len(years)))
+    arr = (rng.uniform(0.01, 1, len(cos))[:, None] * np.cumprod(growth, axis=1)).ravel()
+    arr = np.minimum(arr, 1e4)
+    fin = pd.DataFrame({
+        "company": company, "year": year, "arr": arr, "rev": arr * rng.uniform(0.5, 1, n),
+        "val": arr * rng.uniform(10, 80, n), "margin": rng.uniform(10, 85, n),
+        "burn": rng.uniform(0.1, 20, n), "loss": -rng.uniform(0.1, 20, n),
+    })
+    mau = rng.uniform(1, 800, n)
+    usr = pd.DataFrame({
+        "company": company, "year": year, "mau": mau, "paid": mau * 0.05,
+        "enterprise": rng.uniform(0, 1000, n), "share": rng.dirichlet(np.ones(len(cos)), len(years)).T.ravel() * 100,
+    })
+    arpu, cac = rng.uniform(15, 200, n), rng.uniform(30, 500, n)
+    ue = pd.DataFrame({
+        "company": company, "year": year, "arpu": arpu, "ltv": arpu * 36, "cac": cac,
+        "ltvcac": arpu * 36 / cac, "burn_mult": rng.uniform(0.3, 10, n),
+    })
+    pyears = np.array([2026, 2028, 2030])
+    base = rng.uniform(5, 200, len(cos) * len(pyears))
+    proj = pd.DataFrame({
+        "company": np.repeat(cos, len(pyears)), "year": np.tile(pyears, len(cos)),
+        "base": base, "bull": base * 1.5, "bear": base * 0.6,
+    })
+    seed_tools = seed_frames()[4]
+    tools = pd.concat([seed_tools] * max(1, n_companies // 5), ignore_index=True)
+
+    cube = MetricCube.from_frames(fin, usr, ue, proj, companies=cos)
+    return Dataset(fin, usr, ue, proj, tools, cube, f"synthetic-{n_companies}x{n_periods}-{seed}")
+
+
+# ── MEASUREMENT ────────────────────────────────────────────────────────────────
+_RUNS = itertools.count()
+
+def _fresh(d):
+    """`d` under a version no cache has seen: analytics, rankings, tool_index
+    and scenario fans are all keyed on it, so the next build starts cold."""
+    return d._replace(version=f"{d.version}-run{next(_RUNS)}")
+
+
+def measure(d, name, repeat=3):
+    cos = tuple(d.cube.companies)
+    build = charts.BUILDERS[name]
+    cold = []
+    for _ in range(repeat):
+        dv = _fresh(d)
+        t0 = time.perf_counter()
+        js = build(dv, cos).to_json()
+        cold.append(time.perf_counter() - t0)
+    warm = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        build(dv, cos).to_json()
+        warm = min(warm, time.perf_counter() - t0)
+    # Peak memory is traced separately so tracemalloc overhead stays out of the timing.
+    dv = _fresh(d)
+    tracemalloc.start()
+    build(dv, cos).to_json()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"build_ms": round(float(np.median(cold)) * 1000, 3), "warm_ms": round(warm * 1000, 3),
+            "bytes": len(js), "peak_kb": round(peak / 1024, 1)}
+
+
+def apptest_runs():
+    """Wall time of one full script run per view, through Streamlit's AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "streamlit_app.py"), default_timeout=120)
+    t0 = time.perf_counter()
+    at.run()
+    out = {"first_run": {"run_ms": round((time.perf_counter() - t0) * 1000, 1),
+                         "charts": len(at.get("plotly_chart"))}}
+    for label in at.radio(key="view").options:
+        t0 = time.perf_counter()
+        at.radio(key="view").set_value(label).run()
+        out[label] = {"run_ms": round((time.perf_counter() - t0) * 1000, 1),
+                      "charts": len(at.get("plotly_chart"))}
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return out
+
+
+_COLD = """
+import time
+import data_store, charts
+t0 = time.perf_counter()
+d = data_store.load_dataset()
+t1 = time.perf_counter()
+for build in charts.TABS["overview"]:
+    build(d, tuple(d.cube.companies)).to_json()
+print(round((t1 - t0) * 1000, 1), round((time.perf_counter() - t1) * 1000, 1))
+"""
+
+def app_imports():
+    """Modules streamlit_app.py imports at the top level, in order."""
+    tree = ast.parse((ROOT / "streamlit_app.py").read_text())
+    out = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            out += [a.name for a in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            out.append(node.module)
+    return list(dict.fromkeys(out))
+
+
+def startup_profile(top=15):
+    """Cold-start cost in fresh interpreters: per-module import times, then data + first view."""
+    mods = app_imports()
+    p = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + ", ".join(mods)],
+                       cwd=ROOT, capture_output=True, text=True, check=True)
+    rows = []
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cum_us), depth))
+    cold = subprocess.run([sys.executable, "-c", _COLD], cwd=ROOT, capture_output=True, text=True, check=True)
+    load_ms, first_view_ms = map(float, cold.stdout.split())
+    ms = lambda us: round(us / 1000, 1)
+    return {
+        "import_ms":     ms(sum(c for _, _, c, depth in rows if depth == 0)),
+        "load_ms":       load_ms,
+        "first_view_ms": first_view_ms,
+        "app_imports":   {n: ms(c) for n, _, c, depth in rows if depth == 0 and n in mods},
+        "slowest_self":  {n: ms(s) for n, s, _, _ in sorted(rows, key=lambda r: -r[1])[:top]},
+    }
+
+
+# ── BUDGETS ────────────────────────────────────────────────────────────────────
+def budget_for(budgets, size, chart):
+    """Per-chart size override → per-chart default → per-size default → global default."""
+    rule = dict(budgets.get("default", {}))
+    rule.update(budgets.get("sizes", {}).get(size, {}))
+    rule.update(budgets.get("charts", {}).get(chart, {}).get("default", {}))
+    rule.update(budgets.get("charts", {}).get(chart, {}).get(size, {}))
+    return rule
+
+
+def check(report, budgets, baseline=None, tolerance=0.25):
+    failures = []
+    for size, results in report["results"].items():
+        for chart, m in results.items():
+            for metric, limit in budget_for(budgets, size, chart).items():
+                if m[metric] > limit:
+                    failures.append(f"{size} {chart}: {metric}={m[metric]} > budget {limit}")
+            old = (baseline or {}).get("results", {}).get(size, {}).get(chart)
+            for metric in ("bytes", "peak_kb", "build_ms", "warm_ms") if old else ():
+                if old.get(metric) and m[metric] > old[metric] * (1 + tolerance):
+                    failures.append(f"{size} {chart}: {metric}={m[metric]} vs baseline {old[metric]} (+{tolerance:.0%})")
+    for metric, limit in budgets.get("startup", {}).items() if "startup" in report else ():
+        if report["startup"][metric] > limit:
+            failures.append(f"startup: {metric}={report['startup'][metric]} > budget {limit}")
+    return failures
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--companies", default="5,50,500")
+    ap.add_argument("--periods", default="4,120")
+    ap.add_argument("--charts", default="", help="comma-separated builder names (default: all)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--budgets", default=str(BUDGETS))
+    ap.add_argument("--baseline", help="earlier report to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    ap.add_argument("--apptest", action="store_true", help="also time full AppTest reruns per view")
+    ap.add_argument("--startup", action="store_true", help="also profile cold-start imports and first view")
+    ap.add_argument("--out", default="bench_report.json")
+    args = ap.parse_args(argv)
+
+    names = [n for n in args.charts.split(",") if n] or list(charts.BUILDERS)
+    report = {
+        "python":   platform.python_version(),
+        "platform": platform.platform(),
+        "results":  {},
+    }
+    for n_co in map(int, args.companies.split(",")):
+        for n_p in map(int, args.periods.split(",")):
+            size = f"{n_co}x{n_p}"
+            d = synthetic_dataset(n_co, n_p)
+            report["results"][size] = {name: measure(d, name, args.repeat) for name in names}
+            worst = max(report["results"][size].items(), key=lambda kv: kv[1]["build_ms"])
+            print(f"{size:>9}  slowest {worst[0]} {worst[1]['build_ms']:.1f} ms cold, "
+                  f"{worst[1]['warm_ms']:.1f} ms warm")
+    if args.apptest:
+        report["apptest"] = apptest_runs()
+    if args.startup:
+        st = report["startup"] = startup_profile()
+        print(f"  startup  imports {st['import_ms']:.0f} ms, load {st['load_ms']:.0f} ms, "
+              f"first view {st['first_view_ms']:.0f} ms")
+        for name, t in st["app_imports"].items():
+            print(f"    {name:<24} {t:8.1f} ms")
+
+    Path(args.out).write_text(json.dumps(report, indent=2))
+    budgets = json.loads(Path(args.budgets).read_text()) if Path(args.budgets).exists() else {}
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    failures = check(report, budgets, baseline, args.tolerance)
+    for f in failures:
+        print("FAIL", f)
+    print(f"report → {args.out}  ({len(failures)} budget failures)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
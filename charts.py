@@ -0,0 +1,504 @@
+"""
+DA-AI Chart Builders
+=========================================================
+Pure Plotly figure builders for every chart in the dashboard.
+
+Each builder takes (d, cos, theme) — a data_store.Dataset, the tuple of
+selected companies and a theme name — and returns a fresh go.Figure without
+touching Streamlit. The long time-series charts (RESAMPLED) also take an
+xrange and switch to downsampled WebGL traces past LARGE_POINTS. figure()
+wraps a builder with the shared FigureCache so a given (dataset version,
+chart, filter state, theme) is only built once per process.
+"""
+
+import json
+import os
+import zlib
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import analytics
+import downsample
+import rankings
+import scenarios
+import tool_index
+import tracing
+
+# ── THEME COLOURS ──────────────────────────────────────────────────────────────
+COLORS = {
+    "OpenAI":         "#00D4AA",
+    "Anthropic":      "#FF6B6B",
+    "xAI (Grok)":     "#FFD93D",
+    "Google (Gemini)":"#4ECDC4",
+    "Meta (Llama)":   "#A78BFA",
+}
+BG      = "#080d18"
+BG2     = "#0a111f"
+BORDER  = "#1a2e50"
+TEXT    = "#e2e8f0"
+MUTED   = "#3d5a7a"
+COMPANIES = list(COLORS.keys())
+
+# ── PLOTLY LAYOUT DEFAULTS ─────────────────────────────────────────────────────
+LAYOUT = dict(
+    paper_bgcolor="#0a111f", plot_bgcolor="#0a111f",
+    font=dict(family="IBM Plex Mono", color="#94a3b8", size=11),
+    margin=dict(l=40, r=20, t=40, b=40),
+    legend=dict(bgcolor="#0a111f", bordercolor="#1a2e50", borderwidth=1),
+    xaxis=dict(gridcolor="#111d30", zerolinecolor="#1a2e50", tickfont=dict(color="#3d5a7a")),
+    yaxis=dict(gridcolor="#111d30", zerolinecolor="#1a2e50", tickfont=dict(color="#3d5a7a")),
+)
+THEMES = {"dark": LAYOUT}
+TITLE_FONT = dict(size=12, color="#64748b")
+
+def _merge(base, over):
+    out = dict(base)
+    for k, v in over.items():
+        out[k] = _merge(out[k], v) if isinstance(v, dict) and isinstance(out.get(k), dict) else v
+    return out
+
+def _template(layout, types):
+    # plotly's stock template with the theme layered on top, so figures look
+    # as they did when every builder merged the theme in with update_layout().
+    # Only the per-trace defaults for `types` are carried: the stock template has
+    # them for every plotly trace type, and validating all of them costs ~10x more.
+    base = pio.templates["plotly"].to_plotly_json()
+    data = {t: v for t, v in base["data"].items() if t in types}
+    layout = _merge(base["layout"], {**layout, "title": {"font": TITLE_FONT}})
+    return go.layout.Template(data=data, layout=layout, _validate=False)
+
+# Compiled once per (theme, trace types) and per process. Nothing is registered
+# with plotly.io, so importing charts leaves pio.templates.default alone.
+_TEMPLATES = {}
+
+def template(theme="dark", types=()):
+    """Theme template carrying plotly's defaults for the given trace types."""
+    key = (theme, frozenset(types))
+    t = _TEMPLATES.get(key)
+    if t is None:
+        t = _TEMPLATES[key] = _template(THEMES[theme], key[1])
+    return t
+
+@tracing.traced("apply_layout")
+def apply_layout(fig, title="", h=320, theme="dark"):
+    """Theme, height and title; call it after the traces are added."""
+    # The template is plotly's own stock template plus THEMES, so skip
+    # re-validating it per figure, as plotly does when applying its default.
+    fig.layout._validate = False
+    try:
+        fig.layout.template = template(theme, {trace.type for trace in fig.data})
+    finally:
+        fig.layout._validate = fig._validate
+    fig.layout.height = h
+    if title:
+        fig.layout.title.text = title
+    return fig
+
+_PALETTE = list(COLORS.values()) + ["#F472B6", "#60A5FA", "#FB923C", "#34D399", "#C084FC"]
+
+def color(c):
+    """Company colour; companies outside COLORS get a stable palette slot."""
+    return COLORS.get(c) or _PALETTE[zlib.crc32(c.encode()) % len(_PALETTE)]
+
+def short(c):
+    return c.split(" ")[0]
+
+def _rgba(hex_color, alpha):
+    r, g, b = (int(hex_color[i:i+2], 16) for i in (1, 3, 5))
+    return f"rgba({r},{g},{b},{alpha})"
+
+# ── LARGE SERIES ───────────────────────────────────────────────────────────────
+# Above LARGE_POINTS plotted points a line chart switches to WebGL (Scattergl)
+# and every trace is LTTB-downsampled so the whole figure carries roughly
+# MAX_POINTS points, however many companies × periods are behind it. Passing
+# xrange=(x0, x1) resamples just that window at full budget (zooming in).
+LARGE_POINTS = int(os.environ.get("DASH_LARGE_POINTS", 1500))
+MAX_POINTS   = int(os.environ.get("DASH_MAX_POINTS", 4000))
+MIN_TRACE_POINTS = 16
+RESAMPLED = ("arr_trajectory", "arr_trend", "margin_trend", "revenue_projection")
+FAN_IQR_MAX = 50    # arr_fan draws the p25–p75 band up to this many companies
+
+def _window(x, y, xrange):
+    if xrange is None:
+        return x, y
+    keep = (x >= xrange[0]) & (x <= xrange[1])
+    return x[keep], y[keep]
+
+def points(d, measure, cos, since=None):
+    """Number of plotted (non-NaN) points of `measure` across `cos`."""
+    return sum(len(d.cube.present(measure, c, since)[0]) for c in cos)
+
+def line_factory(n_points, n_traces):
+    """go.Scatter for small charts; otherwise a Scattergl maker that downsamples."""
+    if n_points <= LARGE_POINTS:
+        return go.Scatter
+    budget = max(MIN_TRACE_POINTS, MAX_POINTS // max(n_traces, 1))
+    def scattergl(x, y, **kw):
+        x, y = downsample.lttb(x, y, budget)
+        return go.Scattergl(x=x, y=y, **kw)
+    return scattergl
+
+# ── STATIC TABLES ──────────────────────────────────────────────────────────────
+SEGMENTS = [
+    {"co":"OpenAI","consumer":60,"enterprise":35,"api":5},
+    {"co":"Anthropic","consumer":20,"enterprise":80,"api":0},
+    {"co":"Google","consumer":30,"enterprise":40,"api":30},
+    {"co":"Meta","consumer":0,"enterprise":30,"api":70},
+    {"co":"xAI","consumer":70,"enterprise":20,"api":10},
+]
+SYNERGY = [
+    {"scenario":"OpenAI+Microsoft","synergy":50,"rev2026":150,"prob":70},
+    {"scenario":"Anthropic+Google+AWS","synergy":25,"rev2026":80,"prob":50},
+    {"scenario":"Meta Llama Open","synergy":20,"rev2026":35,"prob":90},
+    {"scenario":"xAI+Tesla","synergy":15,"rev2026":25,"prob":60},
+    {"scenario":"All 5 Coalition","synergy":150,"rev2026":400,"prob":10},
+]
+PARTNERSHIP_SHARE = [
+    {"scenario":"OpenAI+MSFT","prob":70,"share":55},
+    {"scenario":"Anthropic+GCP","prob":50,"share":30},
+    {"scenario":"Meta Open","prob":90,"share":15},
+    {"scenario":"xAI+Tesla","prob":60,"share":10},
+    {"scenario":"All 5","prob":10,"share":95},
+]
+RADAR_CATEGORIES = ["Performance","Cost Effect.","Ease of Use","Data Analysis","Research","Coding"]
+RADAR = {
+    "OpenAI":   [9.5,7.5,9.8,9.0,8.7,8.5],
+    "Anthropic":[9.6,7.0,9.5,9.2,8.55,9.5],
+    "Google":   [9.3,8.5,9.7,8.8,8.69,7.5],
+    "Meta":     [8.9,10.0,8.5,7.5,7.0,7.0],
+    "xAI":      [8.7,6.5,9.0,7.0,7.2,7.0],
+}
+RCOLS = {"OpenAI":"#00D4AA","Anthropic":"#FF6B6B","Google":"#4ECDC4","Meta":"#A78BFA","xAI":"#FFD93D"}
+CO_MAP = {"OpenAI":"#00D4AA","Anthropic":"#FF6B6B","Google":"#4ECDC4","Meta":"#A78BFA","xAI":"#FFD93D","Microsoft":"#4ECDC4","Anysphere":"#A78BFA","Midjourney":"#FFD93D","Perplexity":"#FF6B6B"}
+MARKET = {"year":[2023,2024,2025,2026,2028,2030],"market":[10,28,70,120,250,500]}
+
+
+# ── TAB 1: OVERVIEW ────────────────────────────────────────────────────────────
+def arr_trajectory(d, cos, theme="dark", xrange=None):
+    rows = [(c, *_window(*d.cube.present("arr", c), xrange)) for c in cos]
+    line = line_factory(sum(len(y) for _, _, y in rows), len(rows))
+    fig = go.Figure()
+    for c, yrs, arr in rows:
+        fig.add_trace(line(x=yrs, y=arr, name=short(c), mode="lines+markers",
+            line=dict(color=color(c), width=2.5), marker=dict(size=6, color=color(c))))
+    apply_layout(fig, h=340, theme=theme)
+    fig.update_layout(yaxis_title="ARR ($B)")
+    return fig
+
+def market_share(d, cos, theme="dark"):
+    share_cos, share = _snapshot(d, cos, 2025, "share")
+    fig = go.Figure(go.Pie(
+        labels=[short(c) for c in share_cos],
+        values=share,
+        marker_colors=[color(c) for c in share_cos],
+        hole=0.45, textinfo="label+percent",
+        textfont=dict(size=10,family="IBM Plex Mono"),
+    ))
+    return apply_layout(fig, h=340, theme=theme)
+
+def arr_ranking(d, cos, theme="dark"):
+    arr_cos, arr = _snapshot(d, cos, 2025, "arr")
+    order = np.argsort(arr, kind="stable")
+    arr_cos, arr = [arr_cos[i] for i in order], arr[order]
+    fig = go.Figure(go.Bar(
+        x=arr, y=[short(c) for c in arr_cos],
+        orientation="h",
+        marker_color=[color(c) for c in arr_cos],
+        marker_line_width=0, text=[f"${v:g}B" for v in arr], textposition="outside",
+    ))
+    return apply_layout(fig, h=280, theme=theme)
+
+def mau_2025(d, cos, theme="dark"):
+    mau_cos, mau = _snapshot(d, cos, 2025, "mau")
+    order = np.argsort(-mau, kind="stable")
+    mau_cos, mau = [mau_cos[i] for i in order], mau[order]
+    fig = go.Figure(go.Bar(
+        x=[short(c) for c in mau_cos], y=mau,
+        marker_color=[color(c) for c in mau_cos],
+        marker_line_width=0, text=[f"{v:g}" for v in mau], textposition="outside",
+    ))
+    return apply_layout(fig, h=280, theme=theme)
+
+
+# ── TAB 2: REVENUE ─────────────────────────────────────────────────────────────
+def arr_trend(d, cos, theme="dark", xrange=None):
+    rows = [(c, *_window(*d.cube.present("arr", c), xrange)) for c in cos]
+    line = line_factory(sum(len(y) for _, _, y in rows), len(rows))
+    fig = go.Figure()
+    for c, yrs, arr in rows:
+        fig.add_trace(line(x=yrs,y=arr,name=short(c),
+            mode="lines+markers",line=dict(color=color(c),width=2.5),marker=dict(size=7,color=color(c))))
+    apply_layout(fig, h=300, theme=theme)
+    fig.update_layout(yaxis_title="ARR ($B)")
+    return fig
+
+def segment_mix(d, cos, theme="dark"):
+    shorts = {short(c) for c in cos}
+    seg = [r for r in SEGMENTS if r["co"] in shorts]
+    fig = go.Figure()
+    for col,color,name in [("consumer","#00D4AA","Consumer"),("enterprise","#A78BFA","Enterprise"),("api","#FFD93D","API")]:
+        fig.add_trace(go.Bar(name=name,x=[r["co"] for r in seg],y=[r[col] for r in seg],marker_color=color,marker_line_width=0))
+    fig.update_layout(barmode="stack")
+    return apply_layout(fig, h=300, theme=theme)
+
+YOY_PERIODS = 3   # latest year-over-year periods shown as grouped bars
+
+def yoy_growth(d, cos, theme="dark"):
+    growth = analytics.for_dataset(d).pivot("rev_yoy").round(0).tail(YOY_PERIODS)
+    periods = [f"{y - 1}→{y % 100:02d}" for y in growth.index]
+    fig = go.Figure()
+    for c in cos:
+        if c in growth and growth[c].notna().any():
+            fig.add_trace(go.Bar(name=short(c),x=periods,y=growth[c],
+                marker_color=color(c),marker_line_width=0))
+    fig.update_layout(barmode="group")
+    return apply_layout(fig, h=280, theme=theme)
+
+def valuation_vs_arr(d, cos, theme="dark"):
+    val_cos, val, arr = _snapshot(d, cos, 2025, "val", "arr")
+    labels = [short(c) for c in val_cos]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name="Valuation $B",x=labels,y=val,marker_color="#4ECDC4",marker_line_width=0))
+    fig.add_trace(go.Bar(name="ARR $B",x=labels,y=arr,marker_color="#00D4AA",marker_line_width=0))
+    fig.update_layout(barmode="group")
+    return apply_layout(fig, h=280, theme=theme)
+
+
+# ── TAB 3: PROFITABILITY ───────────────────────────────────────────────────────
+def margin_trend(d, cos, theme="dark", xrange=None):
+    rows = [(c, *_window(*d.cube.present("margin", c, since=2023), xrange)) for c in cos]
+    rows = [r for r in rows if len(r[1])]
+    line = line_factory(sum(len(y) for _, _, y in rows), len(rows))
+    fig = go.Figure()
+    for c, yrs, margin in rows:
+        fig.add_trace(line(x=yrs,y=margin,name=short(c),
+            mode="lines+markers",line=dict(color=color(c),width=2.5),marker=dict(size=7)))
+    apply_layout(fig, h=280, theme=theme)
+    fig.update_layout(yaxis_title="Gross Margin (%)")
+    return fig
+
+def ltv_cac(d, cos, theme="dark"):
+    lc_cos, ltvcac = _snapshot(d, cos, 2025, "ltvcac")
+    fig = go.Figure(go.Bar(
+        x=[short(c) for c in lc_cos],
+        y=ltvcac,
+        marker_color=["#00D4AA" if v>=3 else "#FF6B6B" for v in ltvcac],marker_line_width=0,
+        text=[f"{v:g}" for v in ltvcac], textposition="outside",
+    ))
+    fig.add_hline(y=3,line_dash="dash",line_color="#FFD93D",annotation_text="3:1 Target")
+    return apply_layout(fig, h=280, theme=theme)
+
+def efficiency_quadrant(d, cos, theme="dark"):
+    q_cos, arpu, burn_mult = _snapshot(d, cos, 2025, "arpu", "burn_mult")
+    fig = go.Figure()
+    for c, a, b in zip(q_cos, arpu, burn_mult):
+        fig.add_trace(go.Scatter(
+            x=[a],y=[b],name=short(c),
+            mode="markers+text",text=[short(c)],textposition="top center",
+            marker=dict(size=18,color=color(c),opacity=0.85),
+            textfont=dict(size=10,color=color(c))
+        ))
+    fig.add_vline(x=100,line_dash="dash",line_color="#1a2e50")
+    fig.add_hline(y=2,line_dash="dash",line_color="#1a2e50")
+    apply_layout(fig, h=280, theme=theme)
+    fig.update_layout(xaxis_title="ARPU ($) — Higher is better →",yaxis_title="Burn Multiple — Lower is better →",showlegend=False)
+    return fig
+
+def collab_synergy(d, cos, theme="dark"):
+    fig = go.Figure()
+    y = [r["scenario"] for r in SYNERGY]
+    fig.add_trace(go.Bar(name="Synergy $B",y=y,x=[r["synergy"] for r in SYNERGY],orientation="h",marker_color="#A78BFA",marker_line_width=0))
+    fig.add_trace(go.Bar(name="Proj. Rev 2026 $B",y=y,x=[r["rev2026"] for r in SYNERGY],orientation="h",marker_color="#00D4AA",marker_line_width=0))
+    fig.update_layout(barmode="group")
+    return apply_layout(fig, h=280, theme=theme)
+
+
+# ── TAB 4: AI MODELS ───────────────────────────────────────────────────────────
+def capability_radar(d, cos, theme="dark"):
+    shorts = {short(c) for c in cos}
+    fig = go.Figure()
+    for name,vals in RADAR.items():
+        if name in shorts:
+            fig.add_trace(go.Scatterpolar(r=vals+[vals[0]],theta=RADAR_CATEGORIES+[RADAR_CATEGORIES[0]],
+                fill="toself",name=name,line=dict(color=RCOLS[name],width=2),fillcolor=_rgba(RCOLS[name],0.09)))
+    apply_layout(fig, h=360, theme=theme)
+    fig.update_layout(polar=dict(
+        bgcolor="#0a111f",
+        radialaxis=dict(visible=True,range=[0,10],gridcolor="#1a2e50",tickfont=dict(color="#2a3e5a",size=9)),
+        angularaxis=dict(gridcolor="#1a2e50",tickfont=dict(color="#64748b",size=11))
+    ))
+    return fig
+
+def text_gen_scores(d, cos, theme="dark"):
+    tg = tool_index.for_dataset(d).query(cat="Text Generation", by=None, k=None)
+    fig = go.Figure()
+    for col,color,name in [("perf","#00D4AA","Performance"),("cost","#FFD93D","Cost Effect."),("ease","#4ECDC4","Ease of Use"),("score","#A78BFA","Overall")]:
+        fig.add_trace(go.Bar(name=name,x=tg.tool,y=tg[col],marker_color=color,marker_line_width=0))
+    fig.update_layout(barmode="group")
+    apply_layout(fig, h=360, theme=theme)
+    fig.update_layout(yaxis_range=[6,10])
+    return fig
+
+def all_tools(d, cos, theme="dark"):
+    all_sorted = tool_index.for_dataset(d).query(k=None)
+    fig = go.Figure(go.Bar(
+        x=all_sorted.tool, y=all_sorted.score,
+        marker_color=[CO_MAP.get(r,"#475569") for r in all_sorted.co],
+        marker_line_width=0, text=[f"{v:.2f}" for v in all_sorted.score], textposition="outside",
+    ))
+    apply_layout(fig, h=300, theme=theme)
+    fig.update_layout(yaxis_range=[7.5,10])
+    return fig
+
+
+# ── TAB 5: FUTURE GROWTH ───────────────────────────────────────────────────────
+def revenue_projection(d, cos, theme="dark", xrange=None):
+    rows = [(c, _window(*d.cube.present("arr", c), xrange), _window(*d.cube.present("base", c), xrange))
+            for c in cos]
+    line = line_factory(sum(len(h[1]) + len(p[1]) for _, h, p in rows), 2 * len(rows))
+    fig = go.Figure()
+    for c, (hy, hv), (py, pv) in rows:
+        fig.add_trace(line(x=hy,y=hv,name=short(c),
+            mode="lines+markers",line=dict(color=color(c),width=2.5),marker=dict(size=6,color=color(c))))
+        if len(py) and len(hy):
+            fig.add_trace(line(x=np.r_[hy[-1], py],y=np.r_[hv[-1], pv],name=short(c)+" proj.",
+                mode="lines+markers",line=dict(color=color(c),width=2,dash="dot"),
+                marker=dict(size=5,color=color(c)),showlegend=False))
+    apply_layout(fig, h=320, theme=theme)
+    fig.update_layout(yaxis_title="Revenue ($B)")
+    return fig
+
+def arr_fan(d, cos, theme="dark"):
+    """Monte Carlo ARR bands (p5–p95 and p25–p75) around the median path.
+
+    Bands are sent as float32 (the precision the paths were simulated in), and
+    past FAN_IQR_MAX companies only the p5–p95 band is drawn: a thousand
+    overlapping fills are unreadable and doubled the figure's size.
+    """
+    fan = scenarios.fan_for(d)
+    q = list(fan.percentiles)
+    lo, q1, mid, q3, hi = (q.index(p) for p in (5, 25, 50, 75, 95))
+    x = np.asarray(fan.years)
+    xx = np.concatenate([x, x[::-1]])
+    shown = [c for c in cos if c in fan.companies]
+    bands = ((lo, hi, 0.10), (q1, q3, 0.22)) if len(shown) <= FAN_IQR_MAX else ((lo, hi, 0.14),)
+    # Traces go in as dicts in one add_traces() call, so each is validated once
+    # (a go.Scatter is validated when built and again when added).
+    traces = []
+    for c in shown:
+        band = fan.arr[fan.companies.index(c)].astype(np.float32)
+        for a, b, alpha in bands:
+            traces.append(dict(type="scatter", x=xx, y=np.concatenate([band[b], band[a][::-1]]), fill="toself",
+                fillcolor=_rgba(color(c), alpha), line=dict(width=0), hoverinfo="skip",
+                showlegend=False, legendgroup=c))
+        traces.append(dict(type="scatter", x=x, y=band[mid], name=short(c), legendgroup=c,
+            mode="lines+markers", line=dict(color=color(c), width=2), marker=dict(size=5, color=color(c)),
+            customdata=np.stack([band[lo], band[hi]], axis=1),
+            hovertemplate="%{x}: $%{y:.1f}B (p5 $%{customdata[0]:.1f}B – p95 $%{customdata[1]:.1f}B)"))
+    fig = go.Figure()
+    fig.add_traces(traces)
+    apply_layout(fig, h=320, theme=theme)
+    fig.update_layout(yaxis_title="ARR ($B)", yaxis_type="log")
+    return fig
+
+def total_market(d, cos, theme="dark"):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=MARKET["year"],y=MARKET["market"],fill="tozeroy",
+        line=dict(color="#4ECDC4",width=3),
+        fillcolor="rgba(78,205,196,0.15)",name="Market $B"))
+    return apply_layout(fig, h=320, theme=theme)
+
+def scenarios_2030(d, cos, theme="dark"):
+    s_cos, bull, base, bear = _snapshot(d, cos, 2030, "bull", "base", "bear")
+    labels = [short(c) for c in s_cos]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name="🟢 Bull",x=labels,y=bull,marker_color="#00D4AA",marker_line_width=0))
+    fig.add_trace(go.Bar(name="🔵 Base",x=labels,y=base,marker_color="#4ECDC4",marker_line_width=0))
+    fig.add_trace(go.Bar(name="🔴 Bear",x=labels,y=bear,marker_color="#FF6B6B",marker_line_width=0))
+    fig.update_layout(barmode="group")
+    return apply_layout(fig, h=280, theme=theme)
+
+def partnership_share(d, cos, theme="dark"):
+    fig = go.Figure()
+    y = [r["scenario"] for r in PARTNERSHIP_SHARE]
+    fig.add_trace(go.Bar(name="Probability %",y=y,x=[r["prob"] for r in PARTNERSHIP_SHARE],orientation="h",marker_color="#FFD93D",marker_line_width=0))
+    fig.add_trace(go.Bar(name="Market Share %",y=y,x=[r["share"] for r in PARTNERSHIP_SHARE],orientation="h",marker_color="#A78BFA",marker_line_width=0))
+    fig.update_layout(barmode="group")
+    return apply_layout(fig, h=280, theme=theme)
+
+
+# ── TAB 6: RANKINGS ────────────────────────────────────────────────────────────
+def composite_scores(d, cos, theme="dark"):
+    b = rankings.for_dataset(d).board(cos, rankings.YEAR)[::-1]
+    fig = go.Figure(go.Bar(
+        x=b.composite, y=[short(c) for c in b.company], orientation="h",
+        marker_color=[color(c) for c in b.company], marker_line_width=0,
+        text=[f"{v:.0f}" for v in b.composite], textposition="outside",
+    ))
+    return apply_layout(fig, h=280, theme=theme)
+
+def rank_heatmap(d, cos, theme="dark"):
+    b = rankings.for_dataset(d).board(cos, rankings.YEAR)
+    dims = list(rankings.DIMENSIONS)
+    z = b[[f"{k}_score" for k in dims]].to_numpy()
+    fig = go.Figure(go.Heatmap(
+        z=z, x=[k.title() for k in dims], y=[short(c) for c in b.company], zmin=0, zmax=10,
+        colorscale=[[0, "#0a111f"], [0.5, "#1a2e50"], [1, "#00D4AA"]], showscale=False,
+        text=[[f"{v:.0f}/10" for v in row] for row in z], texttemplate="%{text}", xgap=4, ygap=4,
+    ))
+    apply_layout(fig, h=280, theme=theme)
+    fig.update_layout(yaxis_autorange="reversed")
+    return fig
+
+
+def trace_flame(rows, theme="dark"):
+    """Flame-style view of one tracing.Trace: one bar per span, stacked by depth."""
+    fig = go.Figure(go.Bar(
+        base=[r["start_ms"] for r in rows], x=[r["ms"] for r in rows], y=[r["depth"] for r in rows],
+        orientation="h", text=[r["name"] for r in rows], textposition="inside", insidetextanchor="start",
+        marker_color=[_PALETTE[r["depth"] % len(_PALETTE)] for r in rows], marker_line_width=0,
+        hovertext=[f"{r['name']} · {r['ms']:.1f} ms" for r in rows], hoverinfo="text",
+    ))
+    apply_layout(fig, h=60 + 28 * (1 + max((r["depth"] for r in rows), default=0)), theme=theme)
+    fig.update_layout(bargap=0.05, showlegend=False, margin=dict(l=10, r=10, t=10, b=30),
+                      xaxis_title="ms", yaxis=dict(autorange="reversed", showticklabels=False))
+    return fig
+
+
+def _snapshot(d, cos, year, *measures):
+    """cube.snapshot() restricted to the selected companies, in cube order."""
+    all_cos, *vals = d.cube.snapshot(year, *measures)
+    keep = np.array([c in cos for c in all_cos], dtype=bool)
+    return [c for c, k in zip(all_cos, keep) if k], *(v[keep] for v in vals)
+
+
+# ── REGISTRY ───────────────────────────────────────────────────────────────────
+TABS = {
+    "overview":      (arr_trajectory, market_share, arr_ranking, mau_2025),
+    "revenue":       (arr_trend, segment_mix, yoy_growth, valuation_vs_arr),
+    "profitability": (margin_trend, ltv_cac, efficiency_quadrant, collab_synergy),
+    "models":        (capability_radar, text_gen_scores, all_tools),
+    "growth":        (revenue_projection, total_market, arr_fan, scenarios_2030, partnership_share),
+    "rankings":      (composite_scores, rank_heatmap),
+}
+BUILDERS = {b.__name__: b for builders in TABS.values() for b in builders}
+
+
+def figure_json(d, name, cos=tuple(COMPANIES), theme="dark", cache=None, xrange=None):
+    """Serialized figure for one chart, served from `cache` when possible.
+
+    `xrange` (RESAMPLED charts only) rebuilds the chart for that x window.
+    """
+    xrange = tuple(xrange) if xrange is not None and name in RESAMPLED else None
+    key = (d.version, name, tuple(cos), theme) + ((xrange,) if xrange else ())
+    opts = {"xrange": xrange} if xrange else {}
+    build = lambda: BUILDERS[name](d, tuple(cos), theme, **opts).to_json()
+    return build() if cache is None else cache.get_or_build(key, build)
+
+
+def figure(d, name, cos=tuple(COMPANIES), theme="dark", cache=None, xrange=None):
+    # The JSON was produced by a validated figure, so skip plotly's per-property
+    # validation when rehydrating it (it costs more than the original build).
+    return go.Figure(json.loads(figure_json(d, name, cos, theme, cache, xrange)), _validate=False)
@@ -0,0 +1,356 @@
+"""
+DA-AI Live Connectors
+=========================================================
+Scheduled refresh of ARR / valuation / MAU figures from internal REST and SQL
+sources, layered over the workbook and data/ extracts:
+
+    feed = LiveFeed([
+        HttpSource("finance-api", "fin", "http://finance.internal", "/companies/{company}/metrics"),
+        SqliteSource("warehouse", "usr", "warehouse.db",
+                     "SELECT year, monthly_active_users_millions FROM users WHERE company = ?"),
+    ], companies)
+    store = SharedStore(load=feed.load_dataset).start()
+    feed.start(store, interval=300)         # refresh, then publish through the store
+
+or, without code, a live_sources.json next to this file (see from_config()),
+which shared_store.create_store() picks up for both front ends.
+
+Every refresh fetches all (source, company) pairs concurrently on one asyncio
+loop. Each source owns a connection pool (keep-alive http.client connections,
+or DB-API connections from any `connect` factory) that bounds its own
+concurrency, and every attempt runs under the source's timeout with
+exponential backoff and jitter between retries. Blocking I/O runs in worker
+threads, so no async HTTP or DB driver is needed.
+
+Rows come back as records keyed like the warehouse CSV headers
+("ARR (Billions USD)", "arr_usd_billions", ...) and go through the same
+normalize → validate → Aggregator pipeline as data/*.csv (csv_ingest.py), so
+units, aliases and bounds are handled once. A pair that fails keeps its last
+good rows and the error is reported in feed.errors.
+"""
+
+import asyncio
+import http.client
+import json
+import random
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+import pandas as pd
+
+import csv_ingest
+import data_store
+
+CONFIG = data_store.LIVE_SOURCES
+
+
+class HttpError(Exception):
+    def __init__(self, status, url):
+        super().__init__(f"HTTP {status} from {url}")
+        self.status = status
+
+
+# ── POOLS ──────────────────────────────────────────────────────────────────────
+class _Lease:
+    """One connection lent to a worker thread for one call.
+
+    wait_for() cannot stop that thread, so a connection whose caller gave up
+    (timeout, cancellation) or whose call failed is closed by whichever side
+    finishes last, never while the worker is still using it.
+    """
+
+    def __init__(self, conn):
+        self.conn, self._lock = conn, threading.Lock()
+        self._state, self._closed = "idle", False      # idle → busy → done, or abandoned
+
+    def call(self, fn, *args):
+        with self._lock:
+            if self._state == "abandoned":              # caller left before the thread started
+                self._close()
+                return None
+            self._state = "busy"
+        ok = False
+        try:
+            out = fn(self.conn, *args)
+            ok = True
+            return out
+        finally:
+            with self._lock:
+                if not ok or self._state == "abandoned":
+                    self._close()
+                self._state = "done" if self._state == "busy" else self._state
+
+    def abandon(self):
+        """The caller stopped waiting; close now unless the worker still holds it."""
+        with self._lock:
+            if self._state != "busy":
+                self._close()
+            self._state = "abandoned"
+
+    def _close(self):
+        if not self._closed:
+            self._closed = True
+            self.conn.close()
+
+
+class _Pool:
+    """Up to `size` reusable connections, handed to worker threads one at a time."""
+
+    def __init__(self, connect, size):
+        self._connect, self.size = connect, size
+        self._idle, self._sem, self._loop = [], None, None
+        self.opened = 0
+
+    async def run(self, fn, *args, timeout=None):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:      # each refresh runs on a fresh loop
+            self._sem, self._loop = asyncio.Semaphore(self.size), loop
+        async with self._sem:
+            conn = self._idle.pop() if self._idle else self._open()
+            lease = _Lease(conn)
+            try:
+                out = await asyncio.wait_for(asyncio.to_thread(lease.call, fn, *args), timeout)
+            except BaseException:
+                lease.abandon()         # state unknown (timed out mid-request): never reuse
+                raise
+            self._idle.append(conn)
+            return out
+
+    def _open(self):
+        self.opened += 1
+        return self._connect()
+
+    def close(self):
+        while self._idle:
+            self._idle.pop().close()
+
+
+class HttpPool(_Pool):
+    def __init__(self, base_url, size=8, timeout=10.0):
+        u = urlsplit(base_url)
+        cls = http.client.HTTPSConnection if u.scheme == "https" else http.client.HTTPConnection
+        super().__init__(lambda: cls(u.hostname, u.port, timeout=timeout), size)
+        self.base_url, self.prefix = base_url.rstrip("/"), u.path.rstrip("/")
+
+    @staticmethod
+    def _get(conn, path):
+        conn.request("GET", path, headers={"Accept": "application/json"})
+        r = conn.getresponse()
+        return r.status, r.read()
+
+    async def get_json(self, path, timeout=None):
+        status, body = await self.run(self._get, self.prefix + path, timeout=timeout)
+        if status >= 400:
+            raise HttpError(status, self.base_url + path)
+        return json.loads(body)
+
+
+class DbPool(_Pool):
+    """DB-API pool; `connect` is any zero-argument connection factory."""
+
+    @staticmethod
+    def _query(conn, sql, params):
+        cur = conn.cursor()
+        try:
+            cur.execute(sql, params)
+            cols = [c[0] for c in cur.description]
+            return [dict(zip(cols, row)) for row in cur.fetchall()]
+        finally:
+            cur.close()
+
+    async def query(self, sql, params=(), timeout=None):
+        return await self.run(self._query, sql, params, timeout=timeout)
+
+
+# ── SOURCES ────────────────────────────────────────────────────────────────────
+class Source:
+    """One live source feeding `frame` (fin, usr, ue or proj).
+
+    Subclasses implement _fetch(company) → list of records; `fields` renames
+    record keys to CSV-style headers csv_ingest understands.
+    """
+    retry_on = (OSError, TimeoutError, http.client.HTTPException)
+
+    def __init__(self, name, frame, fields=None, timeout=5.0, retries=3, backoff=0.25):
+        if frame not in csv_ingest.STEMS:
+            raise ValueError(f"{name}: unknown frame {frame!r}")
+        self.name, self.frame, self.fields = name, frame, fields or {}
+        self.timeout, self.retries, self.backoff = timeout, retries, backoff
+
+    def retryable(self, e):
+        if isinstance(e, HttpError):
+            return e.status == 429 or e.status >= 500
+        return isinstance(e, self.retry_on)
+
+    async def fetch(self, company):
+        """Records for `company`, retried with exponential backoff + jitter."""
+        for attempt in range(self.retries + 1):
+            try:
+                return await self._fetch(company)
+            except Exception as e:
+                if attempt == self.retries or not self.retryable(e):
+                    raise
+            await asyncio.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+    async def _fetch(self, company):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class HttpSource(Source):
+    """GET base_url + path.format(company=...) → a JSON list (or {"rows": [...]})."""
+
+    def __init__(self, name, frame, base_url, path, pool=8, **kw):
+        super().__init__(name, frame, **kw)
+        self.path, self.pool = path, HttpPool(base_url, pool, timeout=self.timeout)
+
+    async def _fetch(self, company):
+        body = await self.pool.get_json(self.path.format(company=quote(company, safe="")), self.timeout)
+        return body["rows"] if isinstance(body, dict) else body
+
+    def close(self):
+        self.pool.close()
+
+
+class SqlSource(Source):
+    """`query` with the company as its single parameter, over a DbPool."""
+    retry_on = Source.retry_on + (sqlite3.OperationalError,)
+
+    def __init__(self, name, frame, connect, query, pool=4, **kw):
+        super().__init__(name, frame, **kw)
+        self.query, self.pool = query, DbPool(connect, pool)
+
+    async def _fetch(self, company):
+        return await self.pool.query(self.query, (company,), self.timeout)
+
+    def close(self):
+        self.pool.close()
+
+
+class SqliteSource(SqlSource):
+    def __init__(self, name, frame, database, query, **kw):
+        connect = lambda: sqlite3.connect(database, timeout=kw.get("timeout", 5.0), check_same_thread=False)
+        super().__init__(name, frame, connect, query, **kw)
+
+
+# ── NORMALIZATION ──────────────────────────────────────────────────────────────
+def normalize_records(source, company, records):
+    """Records → validated canonical rows for source.frame (csv_ingest pipeline)."""
+    if not records:
+        return None
+    raw = pd.DataFrame(records).rename(columns=source.fields)
+    if "company" not in raw:
+        raw["company"] = company
+    raw = raw.astype(object).where(raw.notna(), None).map(lambda v: None if v is None else str(v))
+    return pd.concat(list(csv_ingest.validate(
+        csv_ingest.normalize([(1, raw)], source.frame, data_store.COMPANY_ALIASES),
+        f"{source.name}:{company}")))
+
+
+# ── FEED ───────────────────────────────────────────────────────────────────────
+class LiveFeed:
+    def __init__(self, sources, companies=None, interval=300.0):
+        self.sources, self.companies, self.interval = list(sources), companies, interval
+        self.frames, self.errors = {}, {}
+        self._rows = {}                 # (source, company) → last good normalized rows
+        self.refreshed_at = None
+        self._thread, self._stop = None, threading.Event()
+
+    async def _one(self, source, company):
+        key = (source.name, company)
+        try:
+            rows = await source.fetch(company)
+            self._rows[key] = normalize_records(source, company, rows)
+            self.errors.pop(key, None)
+        except Exception as e:
+            self.errors[key] = f"{type(e).__name__}: {e}".rstrip(": ")
+
+    async def refresh(self):
+        """Fetch every (source, company) concurrently; returns True if the frames changed."""
+        companies = self.companies or list(data_store.seed_frames()[0].company.unique())
+        await asyncio.gather(*(self._one(s, c) for s in self.sources for c in companies))
+        # Sources feeding the same frame aggregate together, like several
+        # data/*.csv extracts sharing a prefix.
+        aggs, frame_of = {}, {s.name: s.frame for s in self.sources}
+        for (name, _), df in self._rows.items():
+            if df is not None:
+                aggs.setdefault(frame_of[name], csv_ingest.Aggregator()).feed(df)
+        frames = {f: agg.frame() for f, agg in aggs.items()}
+        self.refreshed_at = time.time()
+        changed = frames.keys() != self.frames.keys() or any(
+            not frames[f].equals(self.frames[f]) for f in frames)
+        self.frames = frames
+        return changed
+
+    def load_dataset(self):
+        """data_store.load_dataset() with the latest live frames layered on top."""
+        return data_store.load_dataset(live=self.frames)
+
+    def start(self, store, interval=None):
+        """Refresh every `interval` seconds in a daemon thread, reloading `store` on change."""
+        self.companies = self.companies or list(store.current().cube.companies)
+        def run():
+            while True:
+                if asyncio.run(self.refresh()):
+                    store.reload()
+                if self._stop.wait(interval or self.interval):
+                    break
+        if self._thread is None:
+            self._thread = threading.Thread(target=run, name="live-feed", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for s in self.sources:
+            s.close()
+
+
+# ── CONFIG ─────────────────────────────────────────────────────────────────────
+def from_config(path=CONFIG):
+    """LiveFeed described by a JSON file, or None when there is none:
+
+        {"interval": 300, "companies": ["OpenAI", ...],          (optional)
+         "sources": [
+           {"type": "http", "name": "finance-api", "frame": "fin",
+            "base_url": "http://finance.internal", "path": "/companies/{company}/metrics",
+            "timeout": 5, "retries": 3, "pool": 8, "fields": {"arr_bn": "ARR (Billions USD)"}},
+           {"type": "sqlite", "name": "warehouse", "frame": "usr",
+            "database": "warehouse.db", "query": "SELECT ... WHERE company = ?"}]}
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    cfg = json.loads(path.read_text())
+    kinds = {"http": HttpSource, "sqlite": SqliteSource}
+    sources = []
+    for spec in cfg["sources"]:
+        spec = dict(spec)
+        kind = spec.pop("type")
+        if kind not in kinds:
+            raise ValueError(f"{path}: unknown source type {kind!r}")
+        if kind == "sqlite" and not Path(spec["database"]).is_absolute():
+            spec["database"] = str(path.parent / spec["database"])
+        sources.append(kinds[kind](**spec))
+    return LiveFeed(sources, cfg.get("companies"), float(cfg.get("interval", 300)))
+
+
+if __name__ == "__main__":
+    # One refresh from the config (or the file given), printing what came back.
+    feed = from_config(sys.argv[1] if len(sys.argv) > 1 else CONFIG)
+    if feed is None:
+        sys.exit(f"no live source config at {CONFIG}")
+    t0 = time.perf_counter()
+    asyncio.run(feed.refresh())
+    print(f"{len(feed.sources)} sources, {time.perf_counter() - t0:.2f}s")
+    for frame, df in feed.frames.items():
+        print(f"\n[{frame}]\n{df.to_string(index=False)}")
+    for (source, company), err in sorted(feed.errors.items()):
+        print(f"FAIL {source} / {company}: {err}")
+    feed.stop()
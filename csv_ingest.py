@@ -0,0 +1,233 @@
+"""
+DA-AI CSV Ingestion
+=========================================================
+Streaming loader for the warehouse extracts in data/:
+
+    data/
+    ├── 01_Company_Financial_Metrics.csv        → fin
+    ├── 02_User_Growth_Metrics.csv              → usr
+    ├── 05_Unit_Economics_Financial_Ratios.csv  → ue
+    ├── 06_Market_Projections_2026_2030.csv     → proj
+    └── 01_*.csv, 02_*.csv, ...                 (any further extracts per prefix)
+
+Each file flows through a generator pipeline, one chunk at a time:
+
+    read_chunks → normalize → validate → Aggregator.feed
+
+normalize() maps workbook-style headers ("ARR (Millions USD)") to the
+dashboard's measures, converts units to the canonical ones ($B, %, M users)
+from the header's unit words and coerces dtypes. validate() rejects rows
+with unparseable or implausible values (a share above 100%, a negative ARR).
+The Aggregator folds every chunk into running per-(company, year) state, so
+peak memory is one chunk plus the company × year result however large the
+export is, and monthly or per-product rows collapse to the annual grain the
+charts read:
+
+    flows   rev, burn, loss                     summed over the year
+    stocks  arr, val, mau, paid, enterprise,    value at the latest period of
+            base, bull, bear                    the year, summed over products
+    ratios  margin, share, arpu, ltv, cac,      mean over the year's rows
+            ltvcac, burn_mult
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT     = Path(__file__).resolve().parent
+DATA_DIR = ROOT / "data"
+
+# File prefix → dashboard frame, and each frame's measure stems (header with
+# the unit words removed) → (measure, canonical unit).
+FRAMES = {"01": "fin", "02": "usr", "05": "ue", "06": "proj"}
+STEMS = {
+    "fin": {
+        "arr": ("arr", "billions"), "revenue": ("rev", "billions"),
+        "valuation": ("val", "billions"), "gross_margin": ("margin", "percent"),
+        "cash_burn": ("burn", "billions"), "net_loss_profit": ("loss", "billions"),
+    },
+    "usr": {
+        "monthly_active_users": ("mau", "millions"), "paid_subscribers": ("paid", "millions"),
+        "enterprise_customers": ("enterprise", "thousands"), "market_share": ("share", "percent"),
+    },
+    "ue": {
+        "arpu": ("arpu", "units"), "ltv_estimated": ("ltv", "units"), "cac_estimated": ("cac", "units"),
+        "ltv": ("ltv", "units"), "cac": ("cac", "units"),
+        "ltv_cac_ratio": ("ltvcac", "units"), "burn_multiple": ("burn_mult", "units"),
+    },
+    "proj": {
+        "revenue_projection_base_case": ("base", "billions"),
+        "revenue_projection_bull_case": ("bull", "billions"),
+        "revenue_projection_bear_case": ("bear", "billions"),
+    },
+}
+FLOWS  = {"rev", "burn", "loss"}
+STOCKS = {"arr", "val", "mau", "paid", "enterprise", "base", "bull", "bear"}
+
+SCALE = {"units": 1.0, "thousands": 1e3, "millions": 1e6, "billions": 1e9,
+         "percent": 1.0, "fraction": 100.0}
+_UNIT_WORDS = {"usd": None, "units": "units", "thousands": "thousands", "k": "thousands",
+               "millions": "millions", "mm": "millions", "m": "millions",
+               "billions": "billions", "bn": "billions", "b": "billions",
+               "percent": "percent", "pct": "percent", "fraction": "fraction"}
+_PERCENT_KINDS = {"percent", "fraction"}
+
+# Plausible ranges in canonical units; anything outside is a unit mix-up.
+BOUNDS = {"margin": (-100, 100), "share": (0, 100), "ltvcac": (0, 1000), "burn_mult": (-1000, 1000)}
+NONNEG = {"arr", "rev", "val", "burn", "mau", "paid", "enterprise", "arpu", "ltv", "cac",
+          "base", "bull", "bear"}
+
+
+class SchemaError(ValueError):
+    pass
+
+
+def _snake(name):
+    return re.sub(r"[^0-9a-z]+", "_", str(name).lower()).strip("_")
+
+
+def parse_header(header, frame):
+    """(measure, factor to canonical units) for one CSV header, or None."""
+    words = _snake(header).split("_")
+    units = [_UNIT_WORDS[w] for w in words if w in _UNIT_WORDS and _UNIT_WORDS[w]]
+    stem = "_".join(w for w in words if w not in _UNIT_WORDS)
+    if stem not in STEMS[frame]:
+        return None
+    measure, canon = STEMS[frame][stem]
+    src = units[-1] if units else canon
+    if (src in _PERCENT_KINDS) != (canon in _PERCENT_KINDS):
+        raise SchemaError(f"{header!r}: {src} cannot be converted to {canon}")
+    return measure, SCALE[src] / SCALE[canon]
+
+
+# ── PIPELINE ───────────────────────────────────────────────────────────────────
+def read_chunks(path, chunksize=200_000):
+    """Yield (first data line number, raw chunk); only known columns are parsed."""
+    frame = FRAMES[Path(path).name[:2]]
+    header = pd.read_csv(path, nrows=0).columns
+    keep = [h for h in header if _snake(h) in ("company", "year", "month", "date", "period", "product")
+            or parse_header(h, frame)]
+    line = 2
+    for chunk in pd.read_csv(path, usecols=keep, chunksize=chunksize, dtype=str,
+                             keep_default_na=False, na_values=["", "NA", "N/A", "null"]):
+        yield line, chunk
+        line += len(chunk)
+
+
+def normalize(chunks, frame, aliases=None):
+    """Rename to measures, scale to canonical units, parse dates → year + period."""
+    for line, raw in chunks:
+        out = pd.DataFrame(index=raw.index)
+        cols = {_snake(h): h for h in raw.columns}
+        if "company" not in cols:
+            raise SchemaError("missing required column 'company'")
+        out["company"] = raw[cols["company"]].str.strip().replace(aliases or {})
+        year = pd.to_numeric(raw[cols["year"]], errors="coerce") if "year" in cols else None
+        when = next((cols[k] for k in ("date", "month", "period") if k in cols), None)
+        if when is not None:
+            if year is not None and raw[when].str.len().max() <= 2:   # month number next to a year
+                month = pd.to_numeric(raw[when], errors="coerce")
+            else:
+                ts = pd.to_datetime(raw[when], errors="coerce")
+                year, month = (ts.dt.year if year is None else year), ts.dt.month
+        elif year is not None:
+            month = 12
+        else:
+            raise SchemaError("missing required column 'year' (or 'date'/'month')")
+        out["year"], out["_period"] = year, year * 12 + month
+        for h in raw.columns:
+            parsed = parse_header(h, frame)
+            if parsed:
+                measure, factor = parsed
+                out[measure] = pd.to_numeric(raw[h], errors="coerce") * factor
+                out[f"_bad_{measure}"] = out[measure].isna() & raw[h].notna()
+        out["_line"] = line + np.arange(len(raw))
+        yield out
+
+
+def validate(chunks, path=""):
+    for df in chunks:
+        bad = df["year"].isna() | df["company"].isna()
+        reasons = np.where(bad, "missing company/year", "")
+        for m in [c for c in df.columns if not c.startswith("_") and c not in ("company", "year")]:
+            lo, hi = BOUNDS.get(m, (0 if m in NONNEG else -np.inf, np.inf))
+            out = df[f"_bad_{m}"] | (df[m] < lo) | (df[m] > hi)
+            reasons = np.where(out & (reasons == ""), f"{m} not a number in [{lo}, {hi}]", reasons)
+            bad |= out
+        if bad.any():
+            i = int(np.argmax(bad.to_numpy()))
+            raise SchemaError(f"{path}:{int(df['_line'].iloc[i])}: {reasons[i]} "
+                              f"({int(bad.sum())} bad rows in this chunk)")
+        yield df.drop(columns=[c for c in df.columns if c.startswith("_bad_")])
+
+
+class Aggregator:
+    """Running company × year state; feed() chunks, then frame()."""
+
+    def __init__(self):
+        self.sums, self.counts, self.latest = {}, {}, {}
+
+    def feed(self, df):
+        keys = ["company", "year"]
+        df = df.astype({"year": "int64"})
+        measures = [c for c in df.columns if c not in keys and not c.startswith("_")]
+        for m in measures:
+            part = df[keys + ["_period", m]].dropna(subset=[m])
+            if part.empty:
+                continue
+            if m in STOCKS:
+                # Latest period in this chunk, summed across products.
+                per = part.groupby(keys + ["_period"], sort=False)[m].sum().reset_index()
+                per = per.loc[per.groupby(keys, sort=False)["_period"].idxmax()]
+                state = self.latest.setdefault(m, {})
+                for c, y, p, v in per.itertuples(index=False):
+                    old = state.get((c, y))
+                    if old is None or p > old[0]:
+                        state[c, y] = (p, v)
+                    elif p == old[0]:
+                        state[c, y] = (p, old[1] + v)
+            else:
+                g = part.groupby(keys, sort=False)[m].agg(["sum", "count"])
+                sums, counts = self.sums.setdefault(m, {}), self.counts.setdefault(m, {})
+                for (c, y), s, n in zip(g.index, g["sum"], g["count"]):
+                    sums[c, y] = sums.get((c, y), 0.0) + s
+                    counts[c, y] = counts.get((c, y), 0) + n
+
+    def frame(self):
+        cols = {}
+        for m, state in self.latest.items():
+            cols[m] = pd.Series({k: v for k, (_, v) in state.items()}, dtype=float)
+        for m, sums in self.sums.items():
+            s = pd.Series(sums, dtype=float)
+            cols[m] = s if m in FLOWS else s / pd.Series(self.counts[m], dtype=float)
+        if not cols:
+            return pd.DataFrame(columns=["company", "year"])
+        out = pd.DataFrame(cols)
+        out.index = out.index.set_names(["company", "year"])
+        return out.reset_index().sort_values(["company", "year"], kind="stable").reset_index(drop=True)
+
+
+def ingest(paths, frame, aliases=None, chunksize=200_000):
+    """Stream every file in `paths` into one company × year frame."""
+    agg = Aggregator()
+    for path in paths:
+        for df in validate(normalize(read_chunks(path, chunksize), frame, aliases), path):
+            agg.feed(df)
+    return agg.frame()
+
+
+def files(data_dir=DATA_DIR):
+    """{frame: [csv paths]} for the extracts present in `data_dir`."""
+    out = {}
+    for path in sorted(Path(data_dir).glob("*.csv")):
+        frame = FRAMES.get(path.name[:2])
+        if frame:
+            out.setdefault(frame, []).append(path)
+    return out
+
+
+def load_dir(data_dir=DATA_DIR, aliases=None, chunksize=200_000):
+    """{frame: DataFrame} for every frame with at least one extract in `data_dir`."""
+    return {frame: ingest(paths, frame, aliases, chunksize) for frame, paths in files(data_dir).items()}
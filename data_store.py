@@ -0,0 +1,453 @@
+"""
+DA-AI Data Store
+=========================================================
+Columnar cache in front of Master_AI_Economics_Data.xlsx.
+
+The workbook is parsed with openpyxl once per sheet edit and each sheet is
+written to an uncompressed Arrow IPC file under .store/ so later starts read
+it back instead of re-parsing the xlsx:
+
+    .store/
+    ├── manifest.json                   ← workbook + per-sheet content hashes
+    ├── financial_metrics.arrow
+    ├── user_growth.arrow
+    └── ...
+
+Sheet fingerprints come from the raw worksheet XML inside the xlsx zip, so
+editing one sheet only rebuilds that sheet's Arrow file.
+
+The files are memory-mapped only to read them without an extra buffered copy:
+to_pandas() converts every column into pandas memory, and schema.enforce()
+casts it again, so the Dataset frames are ordinary (owned) pandas frames, not
+views of the store.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import zipfile
+from collections import OrderedDict, namedtuple
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import csv_ingest
+import schema
+from csv_ingest import DATA_DIR
+from metric_cube import MetricCube
+
+ROOT      = Path(__file__).resolve().parent
+WORKBOOK  = ROOT / "Master_AI_Economics_Data.xlsx"
+STORE_DIR = ROOT / ".store"
+SNAPSHOT  = STORE_DIR / "snapshot.arrow"
+LIVE_SOURCES = Path(os.environ.get("DASH_LIVE_SOURCES", ROOT / "live_sources.json"))
+
+SHEETS = {
+    "Financial Metrics": "financial_metrics",
+    "User Growth":       "user_growth",
+    "Tool Comparison":   "tool_comparison",
+    "Partnerships":      "partnerships",
+    "Unit Economics":    "unit_economics",
+    "Projections":       "projections",
+    "Scenarios":         "scenarios",
+    "Growth Analysis":   "growth_analysis",
+    "Executive Summary": "executive_summary",
+}
+
+# Bump when the typing rules below change so stale .arrow files are rebuilt.
+SCHEMA_VERSION = 1
+
+_NS = {
+    "m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "p": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+
+
+# ── FINGERPRINTS ───────────────────────────────────────────────────────────────
+def file_hash(path=WORKBOOK):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def sheet_hashes(path=WORKBOOK):
+    """Hash each worksheet's XML part (plus the shared-string table it indexes)."""
+    with zipfile.ZipFile(path) as z:
+        wb   = ET.fromstring(z.read("xl/workbook.xml"))
+        rels = ET.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+        targets = {r.get("Id"): r.get("Target") for r in rels.findall("p:Relationship", _NS)}
+        names = set(z.namelist())
+        shared = z.read("xl/sharedStrings.xml") if "xl/sharedStrings.xml" in names else b""
+        out = {}
+        for s in wb.find("m:sheets", _NS):
+            target = targets[s.get(f"{{{_NS['r']}}}id")].lstrip("/")
+            part = target if target.startswith("xl/") else "xl/" + target
+            h = hashlib.sha256(str(SCHEMA_VERSION).encode())
+            h.update(z.read(part))
+            h.update(shared)
+            out[s.get("name")] = h.hexdigest()
+    return out
+
+
+# ── TYPING ─────────────────────────────────────────────────────────────────────
+def _snake(name):
+    return re.sub(r"[^0-9a-z]+", "_", str(name).lower()).strip("_")
+
+
+def _typed(df):
+    """Coerce one raw sheet to compact, explicit dtypes.
+
+    Numeric-looking object columns (the workbook stores infinite growth as the
+    string "inf") become float64, whole-number columns become int16/int32 and
+    the remaining text columns become categoricals.
+    """
+    df = df.rename(columns=_snake).dropna(how="all").reset_index(drop=True)
+    for col in df.columns:
+        s = df[col]
+        if s.dtype == object:
+            num = pd.to_numeric(s, errors="coerce")
+            if num.notna().sum() == s.notna().sum() and s.notna().any():
+                s = num
+            else:
+                df[col] = s.astype("string").astype("category")
+                continue
+        if pd.api.types.is_numeric_dtype(s):
+            s = s.astype("float64")
+            finite = s[np.isfinite(s)]
+            if s.notna().all() and len(finite) == len(s) and (finite % 1 == 0).all():
+                s = s.astype("int16" if finite.abs().max() < 2**15 else "int32")
+        df[col] = s
+    return df
+
+
+# ── STORE ──────────────────────────────────────────────────────────────────────
+def _read_manifest():
+    try:
+        return json.loads((STORE_DIR / "manifest.json").read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _atomic_write(path, write):
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_arrow(df, path):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    def write(tmp):
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as w:
+            w.write_table(table)
+    _atomic_write(path, write)
+
+
+def _read_arrow(path):
+    # Copies into pandas memory; the map is closed (and unmapped) on return.
+    with pa.memory_map(str(path), "r") as src:
+        return pa.ipc.open_file(src).read_all().to_pandas()
+
+
+def sync(path=WORKBOOK):
+    """Bring .store/ up to date with the workbook and return the manifest.
+
+    Unchanged workbooks cost one file hash; otherwise only sheets whose XML
+    fingerprint moved are re-parsed.
+    """
+    manifest = _read_manifest()
+    digest = file_hash(path)
+    files_ok = all((STORE_DIR / f"{stem}.arrow").exists() for stem in SHEETS.values())
+    if manifest.get("workbook") == digest and manifest.get("schema") == SCHEMA_VERSION and files_ok:
+        return {**manifest, "rebuilt": []}
+
+    STORE_DIR.mkdir(exist_ok=True)
+    old = manifest.get("sheets", {})
+    new = sheet_hashes(path)
+    stale = [name for name, stem in SHEETS.items()
+             if name in new and (old.get(name, {}).get("hash") != new[name]
+                                 or not (STORE_DIR / f"{stem}.arrow").exists())]
+    if stale:
+        raw = pd.read_excel(path, sheet_name=stale, engine="openpyxl")
+        for name, df in raw.items():
+            df = _typed(df)
+            _write_arrow(df, STORE_DIR / f"{SHEETS[name]}.arrow")
+            old[name] = {"hash": new[name], "file": f"{SHEETS[name]}.arrow", "rows": len(df)}
+
+    manifest = {
+        "workbook": digest,
+        "schema":   SCHEMA_VERSION,
+        "sheets":   {n: old[n] for n in SHEETS if n in old},
+        "rebuilt":  stale,
+    }
+    _atomic_write(STORE_DIR / "manifest.json", lambda tmp: tmp.write_text(json.dumps(manifest, indent=2)))
+    return manifest
+
+
+def load_sheets(path=WORKBOOK):
+    """Return {sheet name: DataFrame}, read from the Arrow store."""
+    manifest = sync(path)
+    return {name: _read_arrow(STORE_DIR / meta["file"]) for name, meta in manifest["sheets"].items()}
+
+
+def dataset_version(path=WORKBOOK):
+    return sync(path)["workbook"][:12]
+
+
+# ── DASHBOARD FRAMES ───────────────────────────────────────────────────────────
+# The workbook uses product-suffixed names in some sheets ("OpenAI (ChatGPT)",
+# "Google Gemini"); the dashboard keys everything on these canonical names.
+COMPANY_ALIASES = {
+    "OpenAI (ChatGPT)":   "OpenAI",
+    "Anthropic (Claude)": "Anthropic",
+    "xAI":                "xAI (Grok)",
+    "Google Gemini":      "Google (Gemini)",
+    "Meta Llama":         "Meta (Llama)",
+}
+TOOL_CATEGORIES = {
+    "Text Generation - General": "Text Generation",
+    "Coding/Development":        "Coding",
+    "Image Generation":          "Image Gen",
+}
+
+_COLUMNS = {
+    "Financial Metrics": {
+        "company": "company", "year": "year", "arr_billions_usd": "arr",
+        "revenue_billions_usd": "rev", "valuation_billions_usd": "val",
+        "gross_margin_percent": "margin", "cash_burn_billions_usd": "burn",
+        "net_loss_profit_billions_usd": "loss",
+    },
+    "User Growth": {
+        "company": "company", "year": "year", "monthly_active_users_millions": "mau",
+        "paid_subscribers_millions": "paid", "enterprise_customers_thousands": "enterprise",
+        "market_share_percent": "share",
+    },
+    "Unit Economics": {
+        "company": "company", "year": "year", "arpu_usd": "arpu", "ltv_usd_estimated": "ltv",
+        "cac_usd_estimated": "cac", "ltv_cac_ratio": "ltvcac", "burn_multiple": "burn_mult",
+    },
+    "Projections": {
+        "company": "company", "year": "year",
+        "revenue_projection_base_case_billions_usd": "base",
+        "revenue_projection_bull_case_billions_usd": "bull",
+        "revenue_projection_bear_case_billions_usd": "bear",
+    },
+    "Tool Comparison": {
+        "use_case_category": "cat", "tool_name": "tool", "company": "co",
+        "performance_rating_out_of_10": "perf", "cost_effectiveness_out_of_10": "cost",
+        "ease_of_use_out_of_10": "ease", "overall_score": "score",
+    },
+}
+
+
+def _select(df, sheet):
+    cols = _COLUMNS[sheet]
+    out = df[list(cols)].rename(columns=cols)
+    if "company" in out:
+        out["company"] = out["company"].astype(str).replace(COMPANY_ALIASES)
+        measures = [c for c in out.columns if c not in ("company", "year")]
+        # Placeholder rows (all zero / blank measures) mark "not yet launched".
+        out = out[out[measures].fillna(0).ne(0).any(axis=1)]
+    return out.reset_index(drop=True)
+
+
+def _seed_order(out, seed):
+    order = {c: i for i, c in enumerate(seed.company.drop_duplicates())}
+    out["_o"] = out.company.map(order).fillna(len(order))
+    return out.sort_values(["_o", "year"], kind="stable").drop(columns="_o").reset_index(drop=True)
+
+
+def _overlay(sheet, seed):
+    """Workbook rows win; seed rows fill (company, year) keys the workbook lacks."""
+    keys = ["company", "year"]
+    sheet = sheet.astype({"year": seed.year.dtype})
+    extra = seed.merge(sheet[keys], on=keys, how="left", indicator=True)
+    extra = extra[extra._merge == "left_only"].drop(columns="_merge")
+    return _seed_order(pd.concat([sheet, extra[sheet.columns]], ignore_index=True), seed)
+
+
+def _combine(extract, base):
+    """Cell-wise: CSV extract values win, `base` fills every cell the extract lacks."""
+    keys = ["company", "year"]
+    extract = extract.astype({"year": base.year.dtype}).set_index(keys)
+    out = extract.combine_first(base.set_index(keys)).reset_index()
+    return _seed_order(out[list(base.columns)], base)
+
+
+def load_frames(path=WORKBOOK, data_dir=DATA_DIR, live=None):
+    """Build the dashboard's (fin, usr, ue, proj, tools) frames.
+
+    Layers, later wins: the built-in seed tables, the workbook (when present;
+    rows it does not cover such as Meta projections stay seeded), any
+    data/*.csv extracts, streamed and aggregated by csv_ingest, then `live`
+    ({frame: DataFrame} from connectors.LiveFeed). The result is cast to the
+    typed layout in schema.py. path=None / data_dir=None skip that layer.
+    """
+    fin, usr, ue, proj, tools = seed_frames()
+    if path and Path(path).exists():
+        sheets = load_sheets(path)
+        fin  = _overlay(_select(sheets["Financial Metrics"], "Financial Metrics"), fin)
+        usr  = _overlay(_select(sheets["User Growth"], "User Growth"), usr)
+        ue   = _overlay(_select(sheets["Unit Economics"], "Unit Economics"), ue)
+        proj = _overlay(_select(sheets["Projections"], "Projections"), proj)
+        tools = _select(sheets["Tool Comparison"], "Tool Comparison")
+        tools["cat"] = tools["cat"].astype(str).replace(TOOL_CATEGORIES)
+        for col in ("tool", "co"):
+            tools[col] = tools[col].astype(str)
+    frames = {"fin": fin, "usr": usr, "ue": ue, "proj": proj}
+    for name, extract in (csv_ingest.load_dir(data_dir, COMPANY_ALIASES) if data_dir else {}).items():
+        frames[name] = _combine(extract, frames[name])
+    for name, extract in (live or {}).items():
+        frames[name] = _combine(extract, frames[name])
+    frames = schema.enforce({**frames, "tools": tools})
+    return tuple(frames[name] for name in schema.FRAMES)
+
+
+# Everything the charts read, plus the version string figure caches key on.
+Dataset = namedtuple("Dataset", "fin usr ue proj tools cube version")
+
+
+def load_dataset(path=WORKBOOK, data_dir=DATA_DIR, live=None):
+    fin, usr, ue, proj, tools = load_frames(path, data_dir, live)
+    version = dataset_version(path) if path and Path(path).exists() else "seed"
+    extracts = [p for ps in csv_ingest.files(data_dir).values() for p in ps] if data_dir else []
+    if extracts:
+        # Extracts can be multi-GB, so they are fingerprinted by size + mtime.
+        h = hashlib.sha256(version.encode())
+        for p in extracts:
+            st = p.stat()
+            h.update(f"{p.name}:{st.st_size}:{st.st_mtime_ns}".encode())
+        version = h.hexdigest()[:12]
+    if live:
+        h = hashlib.sha256(version.encode())
+        for name, df in sorted(live.items()):
+            h.update(name.encode() + pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        version = h.hexdigest()[:12]
+    return Dataset(fin, usr, ue, proj, tools, MetricCube.from_frames(fin, usr, ue, proj), version)
+
+
+# ── PER-DATASET CACHES ─────────────────────────────────────────────────────────
+class VersionCache:
+    """Objects derived from a Dataset (analytics, tool index, rankings, ...),
+    keyed by its version and shared by every thread. A missing entry is built
+    once under the lock; past `keep` entries the oldest version is evicted."""
+
+    def __init__(self, keep=4):
+        self.keep = keep
+        self._items = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key, build=None):
+        """The entry for `key`, built with build() on a miss (None without one)."""
+        with self._lock:
+            if key in self._items:
+                return self._items[key]
+            return None if build is None else self.put(key, build())
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.keep:
+                self._items.popitem(last=False)
+            return value
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+
+def seed_frames():
+    """Hand-maintained tables the dashboard shipped with before the store."""
+    fin = pd.DataFrame([
+        {"company":"OpenAI","year":2022,"arr":0.028,"rev":0.028,"val":29,"margin":10,"burn":0.5,"loss":-0.5},
+        {"company":"OpenAI","year":2023,"arr":2.0,"rev":1.6,"val":57,"margin":15,"burn":2.0,"loss":-1.5},
+        {"company":"OpenAI","year":2024,"arr":3.7,"rev":3.7,"val":157,"margin":20,"burn":5.0,"loss":-5.0},
+        {"company":"OpenAI","year":2025,"arr":20.0,"rev":13.0,"val":300,"margin":50,"burn":9.0,"loss":-8.0},
+        {"company":"Anthropic","year":2022,"arr":0.01,"rev":0.01,"val":4.1,"margin":30,"burn":0.3,"loss":-0.3},
+        {"company":"Anthropic","year":2023,"arr":0.1,"rev":0.1,"val":18.4,"margin":40,"burn":1.2,"loss":-1.1},
+        {"company":"Anthropic","year":2024,"arr":0.85,"rev":0.85,"val":40,"margin":55,"burn":5.3,"loss":-5.3},
+        {"company":"Anthropic","year":2025,"arr":9.0,"rev":5.0,"val":183,"margin":77,"burn":3.0,"loss":-3.0},
+        {"company":"xAI (Grok)","year":2024,"arr":0.1,"rev":0.1,"val":50,"margin":15,"burn":5.0,"loss":-4.9},
+        {"company":"xAI (Grok)","year":2025,"arr":3.2,"rev":1.5,"val":230,"margin":25,"burn":13.0,"loss":-11.5},
+        {"company":"Google (Gemini)","year":2023,"arr":2.0,"rev":307.4,"val":1100,"margin":45,"burn":20,"loss":60},
+        {"company":"Google (Gemini)","year":2024,"arr":8.0,"rev":350,"val":1800,"margin":50,"burn":50,"loss":73.8},
+        {"company":"Google (Gemini)","year":2025,"arr":25.0,"rev":380,"val":2000,"margin":55,"burn":80,"loss":111},
+        {"company":"Meta (Llama)","year":2023,"arr":1.0,"rev":116.6,"val":360,"margin":80,"burn":15,"loss":23.2},
+        {"company":"Meta (Llama)","year":2024,"arr":5.0,"rev":164.5,"val":1200,"margin":81,"burn":40,"loss":62.4},
+        {"company":"Meta (Llama)","year":2025,"arr":15.0,"rev":189.5,"val":1400,"margin":82,"burn":71,"loss":70},
+    ])
+
+    usr = pd.DataFrame([
+        {"company":"OpenAI","year":2022,"mau":1,"paid":0.1,"enterprise":0.1,"share":15},
+        {"company":"OpenAI","year":2023,"mau":100,"paid":5,"enterprise":20,"share":68},
+        {"company":"OpenAI","year":2024,"mau":200,"paid":15,"enterprise":260,"share":65},
+        {"company":"OpenAI","year":2025,"mau":600,"paid":25,"enterprise":600,"share":60.6},
+        {"company":"Anthropic","year":2022,"mau":0.2,"paid":0.005,"enterprise":0.2,"share":0.5},
+        {"company":"Anthropic","year":2023,"mau":0.5,"paid":0.01,"enterprise":0.5,"share":1},
+        {"company":"Anthropic","year":2024,"mau":10,"paid":0.5,"enterprise":50,"share":5},
+        {"company":"Anthropic","year":2025,"mau":30,"paid":2,"enterprise":300,"share":12},
+        {"company":"xAI (Grok)","year":2024,"mau":5,"paid":0.5,"enterprise":5,"share":1},
+        {"company":"xAI (Grok)","year":2025,"mau":64,"paid":5,"enterprise":20,"share":3.5},
+        {"company":"Google (Gemini)","year":2024,"mau":50,"paid":2,"enterprise":100,"share":10},
+        {"company":"Google (Gemini)","year":2025,"mau":450,"paid":10,"enterprise":500,"share":13.4},
+        {"company":"Meta (Llama)","year":2023,"mau":10,"paid":0,"enterprise":0,"share":5},
+        {"company":"Meta (Llama)","year":2024,"mau":200,"paid":0,"enterprise":200,"share":8},
+        {"company":"Meta (Llama)","year":2025,"mau":600,"paid":0,"enterprise":1000,"share":10},
+    ])
+
+    ue = pd.DataFrame([
+        {"company":"OpenAI","year":2023,"arpu":32,"ltv":960,"cac":50,"ltvcac":19.2,"burn_mult":1.3},
+        {"company":"OpenAI","year":2024,"arpu":24.7,"ltv":888,"cac":40,"ltvcac":22.2,"burn_mult":1.4},
+        {"company":"OpenAI","year":2025,"arpu":21.7,"ltv":780,"cac":35,"ltvcac":22.3,"burn_mult":0.7},
+        {"company":"Anthropic","year":2023,"arpu":200,"ltv":7200,"cac":500,"ltvcac":14.4,"burn_mult":12.0},
+        {"company":"Anthropic","year":2024,"arpu":85,"ltv":3060,"cac":250,"ltvcac":12.2,"burn_mult":6.2},
+        {"company":"Anthropic","year":2025,"arpu":166.7,"ltv":6000,"cac":200,"ltvcac":30.0,"burn_mult":0.6},
+        {"company":"xAI (Grok)","year":2024,"arpu":20,"ltv":720,"cac":100,"ltvcac":7.2,"burn_mult":50.0},
+        {"company":"xAI (Grok)","year":2025,"arpu":23.4,"ltv":842,"cac":80,"ltvcac":10.5,"burn_mult":4.1},
+    ])
+
+    proj = pd.DataFrame([
+        {"company":"OpenAI","year":2026,"base":29.4,"bull":40,"bear":20},
+        {"company":"OpenAI","year":2028,"base":75,"bull":100,"bear":50},
+        {"company":"OpenAI","year":2030,"base":125,"bull":200,"bear":80},
+        {"company":"Anthropic","year":2026,"base":20,"bull":30,"bear":12},
+        {"company":"Anthropic","year":2028,"base":70,"bull":90,"bear":40},
+        {"company":"Anthropic","year":2030,"base":100,"bull":150,"bear":60},
+        {"company":"Google (Gemini)","year":2026,"base":50,"bull":75,"bear":35},
+        {"company":"Google (Gemini)","year":2028,"base":120,"bull":180,"bear":80},
+        {"company":"Google (Gemini)","year":2030,"base":200,"bull":300,"bear":130},
+        {"company":"xAI (Grok)","year":2026,"base":5,"bull":10,"bear":3},
+        {"company":"xAI (Grok)","year":2028,"base":14,"bull":25,"bear":8},
+        {"company":"xAI (Grok)","year":2030,"base":25,"bull":50,"bear":15},
+        {"company":"Meta (Llama)","year":2026,"base":25,"bull":38,"bear":15},
+        {"company":"Meta (Llama)","year":2028,"base":60,"bull":90,"bear":35},
+        {"company":"Meta (Llama)","year":2030,"base":100,"bull":150,"bear":60},
+    ])
+
+    tools = pd.DataFrame([
+        {"cat":"Text Generation","tool":"ChatGPT","co":"OpenAI","perf":9.5,"cost":7.5,"ease":9.8,"score":8.96},
+        {"cat":"Text Generation","tool":"Claude 3.5","co":"Anthropic","perf":9.6,"cost":7.0,"ease":9.5,"score":8.80},
+        {"cat":"Text Generation","tool":"Gemini 2.5","co":"Google","perf":9.3,"cost":8.5,"ease":9.7,"score":9.14},
+        {"cat":"Text Generation","tool":"Grok 4","co":"xAI","perf":8.7,"cost":6.5,"ease":9.0,"score":8.10},
+        {"cat":"Text Generation","tool":"Meta AI","co":"Meta","perf":8.9,"cost":10.0,"ease":8.5,"score":9.15},
+        {"cat":"Coding","tool":"Cursor","co":"Anysphere","perf":9.4,"cost":6.5,"ease":9.0,"score":8.45},
+        {"cat":"Coding","tool":"Claude Code","co":"Anthropic","perf":9.5,"cost":6.0,"ease":9.2,"score":8.39},
+        {"cat":"Coding","tool":"GitHub Copilot","co":"Microsoft","perf":8.8,"cost":7.0,"ease":8.5,"score":8.20},
+        {"cat":"Image Gen","tool":"Midjourney","co":"Midjourney","perf":9.7,"cost":6.0,"ease":8.0,"score":8.25},
+        {"cat":"Image Gen","tool":"DALL-E 3","co":"OpenAI","perf":9.2,"cost":7.0,"ease":9.5,"score":8.60},
+        {"cat":"Research","tool":"Perplexity","co":"Perplexity","perf":9.4,"cost":7.0,"ease":9.5,"score":8.70},
+        {"cat":"Research","tool":"Gemini Research","co":"Google","perf":8.9,"cost":8.0,"ease":9.2,"score":8.69},
+        {"cat":"Data Analysis","tool":"ChatGPT Analyst","co":"OpenAI","perf":9.0,"cost":7.5,"ease":9.0,"score":8.55},
+        {"cat":"Data Analysis","tool":"Claude Artifacts","co":"Anthropic","perf":9.2,"cost":7.0,"ease":9.3,"score":8.56},
+        {"cat":"Data Analysis","tool":"AI Studio","co":"Google","perf":8.8,"cost":8.5,"ease":9.0,"score":8.75},
+    ])
+
+    return fin, usr, ue, proj, tools
@@ -0,0 +1,44 @@
+"""
+DA-AI Downsampling
+=========================================================
+Largest-Triangle-Three-Buckets (LTTB) downsampling for line charts.
+
+    x2, y2 = lttb(x, y, 500)
+
+Keeps the first and last point and, for each of the n-2 buckets between
+them, the point forming the largest triangle with the previously kept point
+and the next bucket's mean, so peaks and trend changes survive even at a
+few hundred points. x must be sorted and numeric (years, epoch seconds);
+the returned arrays keep the inputs' original values and dtypes.
+"""
+
+import numpy as np
+
+
+def lttb_index(x, y, n):
+    """Indices of the `n` points LTTB keeps (all of them if len(x) <= n)."""
+    L = len(x)
+    if n >= L or n < 3:
+        return np.arange(L)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    every = (L - 2) / (n - 2)
+    edges = (np.arange(n - 1) * every).astype(np.int64) + 1
+    edges[-1] = L - 1
+    idx = np.empty(n, dtype=np.int64)
+    idx[0], idx[-1] = 0, L - 1
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, (edges[i + 2] if i + 2 < n - 1 else L)
+        ax, ay = x[a], y[a]
+        mx, my = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((ax - mx) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (my - ay))
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+def lttb(x, y, n):
+    idx = lttb_index(x, y, n)
+    return np.asarray(x)[idx], np.asarray(y)[idx]
@@ -0,0 +1,190 @@
+"""
+DA-AI Chart Export
+=========================================================
+Headless board-pack export: every chart builder in charts.py rendered to
+PNG / SVG (via kaleido) and standalone HTML, without Streamlit:
+
+    python export_charts.py                                   # all charts, base case, all companies
+    python export_charts.py --formats png,html --filters all,OpenAI,Anthropic+OpenAI
+    python export_charts.py --scenarios base,bull,bear --workers 8 --out packs/
+
+Output layout, one pack per (scenario, company filter):
+
+    packs/<scenario>/<filter>/<chart>.<fmt>
+    packs/manifest.json                     files, timings, dataset version
+
+Work fans out over a ProcessPoolExecutor (one worker per core by default).
+Each worker loads the dataset once and keeps one kaleido renderer warm for
+all of its charts. Only revenue_projection and arr_fan depend on the
+scenario, so every other chart is rendered once per filter and copied into
+the bull/bear packs instead of being re-rendered.
+
+PNG/SVG need `pip install kaleido` (plus a Chrome it can find or download);
+HTML export works with plotly alone.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import plotly.io as pio
+
+import charts
+import data_store
+
+SCENARIOS = ("base", "bull", "bear")
+# Charts that follow the selected scenario; everything else is scenario-free.
+SCENARIO_CHARTS = ("revenue_projection", "arr_fan")
+IMAGE_FORMATS = ("png", "svg")
+
+
+# ── DATA ───────────────────────────────────────────────────────────────────────
+def with_scenario(d, scenario):
+    """Dataset whose "base" projection is `scenario`'s (a no-op for "base")."""
+    if scenario == "base":
+        return d
+    cube = type(d.cube)(d.cube.values.copy(), d.cube.measures, d.cube.companies, d.cube.years)
+    cube.values[cube._m["base"]] = cube.values[cube._m[scenario]]
+    proj = d.proj.assign(base=d.proj[scenario])
+    return d._replace(proj=proj, cube=cube, version=f"{d.version}+{scenario}")
+
+
+def parse_filter(spec, companies):
+    """'all' → every company; 'OpenAI+xAI (Grok)' → those; names may be short ('xAI')."""
+    if spec == "all":
+        return tuple(companies)
+    by_short = {charts.short(c): c for c in companies}
+    picked = []
+    for part in spec.split("+"):
+        c = part if part in companies else by_short.get(part)
+        if c is None:
+            raise ValueError(f"unknown company {part!r} in filter {spec!r}")
+        picked.append(c)
+    return tuple(c for c in companies if c in picked)
+
+
+def slug(spec):
+    return "".join(ch if ch.isalnum() or ch in "+-" else "_" for ch in spec)
+
+
+# ── WORKER ─────────────────────────────────────────────────────────────────────
+_worker = {}
+
+def _init_worker(formats):
+    # Per-process state: the dataset (loaded once) and, for image formats, a
+    # persistent kaleido browser so each chart is not a cold Chrome start.
+    _worker["data"] = data_store.load_dataset()
+    if set(formats) & set(IMAGE_FORMATS):
+        import kaleido
+        if hasattr(kaleido, "start_sync_server"):
+            kaleido.start_sync_server(silence_warnings=True)
+
+
+def render(task):
+    """Build one chart and write it in every format; returns (task, ms, paths)."""
+    name, cos, scenario, out_dir, formats, scale, inline_js = task
+    t0 = time.perf_counter()
+    fig = charts.BUILDERS[name](with_scenario(_worker["data"], scenario), cos)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for fmt in formats:
+        path = out_dir / f"{name}.{fmt}"
+        if fmt == "html":
+            fig.write_html(path, include_plotlyjs=True if inline_js else "cdn", full_html=True)
+        else:
+            pio.write_image(fig, path, format=fmt, width=1200, height=fig.layout.height or 500, scale=scale)
+        paths.append(str(path))
+    return task, round((time.perf_counter() - t0) * 1000, 1), paths
+
+
+# ── PLAN ───────────────────────────────────────────────────────────────────────
+def plan(names, filters, scenario_list, out, formats, scale, inline_js, companies):
+    """(render tasks, copies): each distinct figure is rendered once, into the
+    first pack that needs it, and copied into the other packs."""
+    tasks, copies, first = [], [], {}
+    for scenario in scenario_list:
+        for spec in filters:
+            cos = parse_filter(spec, companies)
+            pack = Path(out) / scenario / slug(spec)
+            for name in names:
+                key = (name, cos, scenario if name in SCENARIO_CHARTS else "base")
+                if key in first:
+                    copies += [(first[key] / f"{name}.{fmt}", pack / f"{name}.{fmt}") for fmt in formats]
+                else:
+                    first[key] = pack
+                    tasks.append((name, cos, key[2], str(pack), tuple(formats), scale, inline_js))
+    return tasks, copies
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--out", default="packs")
+    ap.add_argument("--formats", default="png,svg,html")
+    ap.add_argument("--charts", default="", help="comma-separated builder names (default: all)")
+    ap.add_argument("--filters", default="all", help="comma-separated company filters: all, OpenAI, OpenAI+xAI, ...")
+    ap.add_argument("--scenarios", default="base", help="comma-separated subset of base,bull,bear")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--scale", type=float, default=2.0, help="PNG pixel density")
+    ap.add_argument("--inline-js", action="store_true", help="embed plotly.js in each HTML file instead of the CDN link")
+    args = ap.parse_args(argv)
+
+    formats = [f for f in args.formats.split(",") if f]
+    names = [n for n in args.charts.split(",") if n] or list(charts.BUILDERS)
+    scenario_list = [s for s in args.scenarios.split(",") if s]
+    for what, bad in (("format", set(formats) - {"png", "svg", "html"}),
+                      ("chart", set(names) - set(charts.BUILDERS)),
+                      ("scenario", set(scenario_list) - set(SCENARIOS))):
+        if bad:
+            ap.error(f"unknown {what}: {', '.join(sorted(bad))}")
+    if set(formats) & set(IMAGE_FORMATS) and importlib.util.find_spec("kaleido") is None:
+        ap.error("PNG/SVG export needs kaleido: pip install kaleido (or use --formats html)")
+
+    d = data_store.load_dataset()
+    try:
+        tasks, copies = plan(names, [f for f in args.filters.split(",") if f], scenario_list,
+                             args.out, formats, args.scale, args.inline_js, d.cube.companies)
+    except ValueError as e:
+        ap.error(str(e))
+
+    t0 = time.perf_counter()
+    timings, failures = {}, []
+    workers = max(1, min(args.workers, len(tasks)))
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(tuple(formats),)) as pool:
+        futures = {pool.submit(render, t): t for t in tasks}
+        for fut in as_completed(futures):
+            task = futures[fut]
+            try:
+                _, ms, paths = fut.result()
+                timings[f"{task[3]}/{task[0]}"] = ms
+            except Exception as e:
+                failures.append(f"{task[3]}/{task[0]}: {type(e).__name__}: {e}")
+    for src, dst in copies:
+        if src.exists():
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, dst)
+    wall = time.perf_counter() - t0
+
+    manifest = {
+        "version": d.version, "formats": formats, "scenarios": scenario_list,
+        "filters": args.filters.split(","), "charts": names, "workers": workers,
+        "rendered": len(tasks), "copied": len(copies) // max(1, len(formats)),
+        "wall_s": round(wall, 2), "render_ms": dict(sorted(timings.items())), "failures": failures,
+    }
+    Path(args.out).mkdir(parents=True, exist_ok=True)
+    (Path(args.out) / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    for f in failures:
+        print("FAIL", f)
+    print(f"{len(tasks)} figures rendered, {manifest['copied']} reused, {workers} workers, "
+          f"{wall:.1f}s → {args.out}/")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
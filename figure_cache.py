@@ -0,0 +1,83 @@
+"""
+DA-AI Figure Cache
+=========================================================
+Process-wide LRU of serialized Plotly figures.
+
+Entries are figure JSON strings keyed by whatever tuple the caller builds
+(charts.figure() uses dataset version, chart id, filter state and theme).
+The cache is bounded by entry count and by total JSON bytes; least recently
+used entries are evicted first and counted in stats().
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class FigureCache:
+    def __init__(self, maxsize=256, max_bytes=64 << 20):
+        self.maxsize   = maxsize
+        self.max_bytes = max_bytes
+        self._entries  = OrderedDict()
+        self._bytes    = 0
+        self._lock     = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            js = self._entries.get(key)
+            if js is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return js
+
+    def put(self, key, js):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = js
+            self._bytes += len(js)
+            while self._entries and (len(self._entries) > self.maxsize or self._bytes > self.max_bytes):
+                _, dropped = self._entries.popitem(last=False)
+                self._bytes -= len(dropped)
+                self.evictions += 1
+
+    def get_or_build(self, key, build):
+        """Return cached JSON for `key`, calling `build()` → JSON on a miss.
+
+        Builds run outside the lock so concurrent sessions never queue behind
+        one slow figure; two sessions missing the same key may both build it.
+        """
+        js = self.get(key)
+        if js is None:
+            js = build()
+            self.put(key, js)
+        return js
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries":   len(self._entries),
+                "maxsize":   self.maxsize,
+                "bytes":     self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits":      self.hits,
+                "misses":    self.misses,
+                "evictions": self.evictions,
+                "hit_rate":  self.hits / total if total else 0.0,
+            }
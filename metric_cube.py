@@ -0,0 +1,83 @@
+"""
+DA-AI Metric Cube
+=========================================================
+Dense company × year view over the dashboard's long-format frames.
+
+Every measure lives in one float64 array of shape (measure, company, year):
+
+    cube.series("arr", "OpenAI")      → row view over cube.years
+    cube.at_year("share", 2025)       → column view over cube.companies
+    cube.snapshot(2025, "val", "arr") → companies reporting 2025 + their values
+
+NaN policy: a company-year that no source frame reports is NaN. Nothing is
+zero-filled or interpolated. series()/at_year() return raw views (NaN
+included, no copy); present()/snapshot() drop the NaN cells and are what the
+charts use, so a company that launched in 2024 simply starts its line there.
+"""
+
+import numpy as np
+
+from schema import to_float64
+
+# Source frame → measures it contributes, in load_data() return order.
+MEASURES = {
+    "fin":  ("arr", "rev", "val", "margin", "burn", "loss"),
+    "usr":  ("mau", "paid", "enterprise", "share"),
+    "ue":   ("arpu", "ltv", "cac", "ltvcac", "burn_mult"),
+    "proj": ("base", "bull", "bear"),
+}
+
+
+class MetricCube:
+    def __init__(self, values, measures, companies, years):
+        self.values    = values
+        self.measures  = tuple(measures)
+        self.companies = tuple(companies)
+        self.years     = np.asarray(years)
+        self._m = {m: i for i, m in enumerate(self.measures)}
+        self._c = {c: i for i, c in enumerate(self.companies)}
+        self._y = {int(y): i for i, y in enumerate(self.years)}
+
+    @classmethod
+    def from_frames(cls, fin, usr, ue, proj, companies=None):
+        frames = {"fin": fin, "usr": usr, "ue": ue, "proj": proj}
+        if companies is None:
+            companies = list(dict.fromkeys(c for df in frames.values() for c in df.company))
+        years = sorted({int(y) for df in frames.values() for y in df.year})
+        measures = [m for key, ms in MEASURES.items() for m in ms if m in frames[key]]
+        cube = cls(np.full((len(measures), len(companies), len(years)), np.nan),
+                   measures, companies, years)
+        for key, df in frames.items():
+            ci = df.company.map(cube._c).to_numpy()
+            yi = df.year.map(cube._y).to_numpy()
+            ok = ~np.isnan(ci.astype(float))
+            ci, yi = ci[ok].astype(int), yi[ok].astype(int)
+            for m in MEASURES[key]:
+                if m in df:
+                    cube.values[cube._m[m], ci, yi] = to_float64(df[m])[ok]
+        return cube
+
+    # ── O(1) views ────────────────────────────────────────────────────────────
+    def series(self, measure, company):
+        return self.values[self._m[measure], self._c[company]]
+
+    def at_year(self, measure, year):
+        return self.values[self._m[measure], :, self._y[year]]
+
+    def value(self, measure, company, year):
+        return self.values[self._m[measure], self._c[company], self._y[year]]
+
+    # ── NaN-dropping helpers for plotting ─────────────────────────────────────
+    def present(self, measure, company, since=None):
+        """(years, values) where `company` reports `measure`, optionally from `since`."""
+        v = self.series(measure, company)
+        keep = ~np.isnan(v)
+        if since is not None:
+            keep &= self.years >= since
+        return self.years[keep], v[keep]
+
+    def snapshot(self, year, *measures):
+        """Companies with any of `measures` in `year`, then one array per measure."""
+        block = self.values[[self._m[m] for m in measures], :, self._y[year]]
+        keep = ~np.isnan(block).all(axis=0)
+        return [c for c, k in zip(self.companies, keep) if k], *block[:, keep]
@@ -0,0 +1,277 @@
+"""
+DA-AI Rankings
+=========================================================
+Composite scores, per-metric ranks and category champions, derived from the
+data layer instead of computed per render (index.html's calcCompScore /
+getRankScore) or typed in (its renderP4Rankings winners):
+
+    r = rankings.for_dataset(d)
+    r.board(("OpenAI", "Anthropic"), 2025)       → company × score / rank table
+    r.champions(("OpenAI", "Anthropic"), 2025)   → winner, runner-up, advantage per category
+
+Per company and year, once per dataset:
+
+    metrics         arr, margin, growth (rev YoY %), ltvcac, val_mult (val / arr), mau
+    rank scores     0–10 per dimension, index.html getRankScore()
+    composite       index.html calcCompScore()
+    order           every company best-first per metric and year (missing last)
+
+Scores don't depend on the selection; ranks and champions do. A selection is
+a bitmask over cube.companies, and a (year, mask) board is computed the first
+time it is asked for — one pass over the precomputed orders — and memoized,
+so repeat lookups are a dict hit. 5 companies have 31 subsets and
+materialize() enumerates them all; a 40-vendor universe has 2^40, so only
+what is asked for is ever built.
+
+    python rankings.py          # materialize and write .store/rankings.arrow
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import analytics
+from data_store import STORE_DIR, VersionCache
+
+YEAR    = 2025
+METRICS = ("arr", "margin", "growth", "ltvcac", "val_mult", "mau")
+LOWER   = {"val_mult"}          # lower is better
+# Dimension → (metric, value worth 10 points), as in getRankScore().
+DIMENSIONS = {"revenue": ("arr", 25), "margin": ("margin", 82), "growth": ("growth", 1400),
+              "efficiency": ("ltvcac", 30), "valuation": ("val_mult", None)}
+CATEGORIES = (
+    ("Revenue Champion",       "arr"),
+    ("Profitability Champion", "margin"),
+    ("Growth Champion",        "growth"),
+    ("Efficiency Champion",    "ltvcac"),
+    ("Value Champion",         "val_mult"),
+    ("Scale Champion",         "mau"),
+)
+ENUMERATE = 5                   # materialize() enumerates every subset up to this many companies
+STORE = STORE_DIR / "rankings.arrow"
+
+
+def _round(x):
+    # Math.round(): halves round up, so scores match index.html exactly.
+    return np.floor(np.asarray(x, dtype=float) + 0.5)
+
+
+def composite(arr, margin, growth, ltvcac, val_mult):
+    """index.html calcCompScore(); missing inputs count as 0 (val_mult as 30)."""
+    arr, margin, growth, ltvcac = (np.nan_to_num(x) for x in (arr, margin, growth, ltvcac))
+    val_mult = np.where(np.isnan(val_mult), 30, val_mult)
+    return _round(arr / 25 * 20 + margin / 82 * 25 + np.minimum(growth / 1400 * 20, 20)
+                  + ltvcac / 30 * 20 + 100 - val_mult / 100 * 15)
+
+
+def rank_score(dimension, v):
+    """index.html getRankScore(): 0–10 for one dimension."""
+    metric, full = DIMENSIONS[dimension]
+    if metric == "val_mult":
+        return _round((1 - np.where(np.isnan(v), 30, v) / 100) * 10)
+    s = _round(np.nan_to_num(v) / full * 10)
+    return np.minimum(s, 10) if metric == "growth" else s
+
+
+# ── FORMATTING ─────────────────────────────────────────────────────────────────
+def format_value(metric, v):
+    return {"arr": f"${v:g}B", "margin": f"{v:g}%", "growth": f"{v:+.0f}%",
+            "ltvcac": f"{v:g}:1 LTV:CAC", "val_mult": f"{round(v, 1):g}× ARR", "mau": f"{v:g}M users"}[metric]
+
+def advantage(metric, win, run):
+    """Winner's lead over the runner-up: pp for margin, % cheaper for val_mult, % otherwise."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if metric == "margin":
+            return win - run
+        if metric in LOWER:
+            return (1 - win / run) * 100 if run > 0 else np.nan
+        return (win / run - 1) * 100 if run > 0 else np.nan
+
+def format_advantage(metric, adv):
+    if np.isnan(adv):
+        return "—"
+    return {"margin": f"{adv:+.0f}pp", "val_mult": f"{adv:.0f}% cheaper"}.get(metric, f"{adv:+.0f}%")
+
+
+# ── RANKINGS ───────────────────────────────────────────────────────────────────
+class Rankings:
+    def __init__(self, cube, growth, version=None):
+        """`growth` is rev YoY % as a company × year array aligned with the cube."""
+        self.version = version
+        self.companies = tuple(cube.companies)
+        self.years = tuple(int(y) for y in cube.years)
+        self._c = {c: i for i, c in enumerate(self.companies)}
+        self._y = {y: j for j, y in enumerate(self.years)}
+        m = lambda name: cube.values[cube.measures.index(name)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cols = {"arr": m("arr"), "margin": m("margin"), "growth": growth, "ltvcac": m("ltvcac"),
+                    "val_mult": m("val") / m("arr"), "mau": m("mau")}
+        self.values = np.stack([np.asarray(cols[k], dtype=float) for k in METRICS])   # metric × company × year
+        self.scores = np.stack([rank_score(k, cols[DIMENSIONS[k][0]]) for k in DIMENSIONS])
+        self.composite = composite(*(cols[k] for k in ("arr", "margin", "growth", "ltvcac", "val_mult")))
+        # Companies best-first per (metric, year), missing values last; the
+        # composite (never missing) is the last row.
+        keys = np.concatenate([self.values, self.composite[None]])
+        keys = np.where([[[k in LOWER]] for k in METRICS + ("composite",)], keys, -keys)
+        self.order = np.argsort(np.nan_to_num(keys, nan=np.inf), axis=1, kind="stable")
+        self.present = ~np.isnan(self.values)
+        self._boards, self._champions = {}, {}
+
+    def mask(self, cos):
+        """Bitmask of `cos` over self.companies."""
+        try:
+            return sum(1 << self._c[c] for c in set(cos))
+        except KeyError as e:
+            raise KeyError(f"unknown company {e.args[0]!r}") from None
+
+    def _members(self, mask):
+        return np.array([(mask >> i) & 1 for i in range(len(self.companies))], dtype=bool)
+
+    def _year(self, year):
+        if year not in self._y:
+            raise KeyError(f"no data for year {year}")
+        return self._y[year]
+
+    def _ranks(self, year, mask):
+        """rank of every member per metric (and composite), 1-based, 0 if not reported."""
+        j, member = self._year(year), self._members(mask)
+        ranks = np.zeros((len(METRICS) + 1, len(self.companies)), dtype=np.int16)
+        for k in range(len(METRICS) + 1):
+            o = self.order[k, :, j]
+            o = o[member[o]]
+            if k < len(METRICS):
+                o = o[self.present[k, o, j]]
+            ranks[k, o] = np.arange(1, len(o) + 1)
+        return ranks
+
+    def board(self, cos, year=YEAR):
+        """Members of `cos` in composite order: metrics, rank scores, ranks.
+
+        Memoized per (year, subset); the frame is shared, so don't mutate it.
+        """
+        key = (year, self.mask(cos))
+        out = self._boards.get(key)
+        if out is None:
+            j, ranks = self._year(year), self._ranks(*key)
+            idx = self.order[-1, :, j]
+            idx = idx[self._members(key[1])[idx]]
+            out = pd.DataFrame({"company": [self.companies[i] for i in idx],
+                                "rank": ranks[-1, idx], "composite": self.composite[idx, j]})
+            for k, dim in enumerate(DIMENSIONS):
+                out[f"{dim}_score"] = self.scores[k, idx, j]
+            for k, m in enumerate(METRICS):
+                out[m] = self.values[k, idx, j]
+                out[f"{m}_rank"] = ranks[k, idx]
+            self._boards[key] = out
+        return out
+
+    def champions(self, cos, year=YEAR):
+        """Per CATEGORIES entry: winner, value, runner-up and its advantage (list of dicts)."""
+        key = (year, self.mask(cos))
+        out = self._champions.get(key)
+        if out is None:
+            j, ranks = self._year(year), self._ranks(*key)
+            out = []
+            for cat, m in CATEGORIES:
+                k = METRICS.index(m)
+                win, run = (np.flatnonzero(ranks[k] == r) for r in (1, 2))
+                if not len(win):
+                    continue
+                w = self.values[k, win[0], j]
+                r = self.values[k, run[0], j] if len(run) else np.nan
+                adv = round(advantage(m, w, r), 1)
+                out.append({"category": cat, "metric": m, "winner": self.companies[win[0]],
+                            "value": float(w), "value_text": format_value(m, w),
+                            "runner_up": self.companies[run[0]] if len(run) else None,
+                            "advantage": None if np.isnan(adv) else float(adv),
+                            "advantage_text": format_advantage(m, adv)})
+            self._champions[key] = out
+        return out
+
+    # ── materialization ───────────────────────────────────────────────────────
+    def materialize(self, limit=ENUMERATE):
+        """Champions for every subset and year when the universe has ≤ `limit`
+        companies (2^n − 1 subsets), else for the whole universe only."""
+        n = len(self.companies)
+        masks = range(1, 1 << n) if n <= limit else [(1 << n) - 1]
+        for year in self.years:
+            for mask in masks:
+                self.champions([c for i, c in enumerate(self.companies) if mask >> i & 1], year)
+        return len(self._champions)
+
+    def table(self):
+        """Compact lookup table of every materialized (year, subset) champion."""
+        rows = [{"year": y, "mask": mask, **{k: ch[k] for k in ("category", "winner", "value",
+                 "runner_up", "advantage")}}
+                for (y, mask), champs in self._champions.items() for ch in champs]
+        df = pd.DataFrame(rows, columns=["year", "mask", "category", "winner", "value", "runner_up", "advantage"])
+        return df.astype({"year": "int16", "mask": "int64", "category": "category", "winner": "category",
+                          "runner_up": "category"})
+
+    def save(self, path=STORE):
+        """Write table() as Arrow IPC, tagged with the dataset version."""
+        t = pa.Table.from_pandas(self.table(), preserve_index=False)
+        t = t.replace_schema_metadata({**(t.schema.metadata or {}), b"version": str(self.version).encode()})
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True)
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, t.schema) as w:
+            w.write_table(t)
+        return path
+
+    def load(self, path=STORE):
+        """Seed the champion memo from a table save()d for this dataset version.
+        Returns the number of (year, subset) entries loaded (0 if stale or absent)."""
+        try:
+            with pa.memory_map(str(path), "r") as src:
+                t = pa.ipc.open_file(src).read_all()
+        except (OSError, pa.ArrowInvalid):
+            return 0
+        if (t.schema.metadata or {}).get(b"version") != str(self.version).encode():
+            return 0
+        return self.seed(t.to_pandas())
+
+    def seed(self, table):
+        """Seed the champion memo from a table() of this dataset; returns the entry count."""
+        for (y, mask), g in table.groupby(["year", "mask"], sort=False, observed=True):
+            self._champions[int(y), int(mask)] = [
+                {"category": r.category, "metric": m, "winner": r.winner, "value": float(r.value),
+                 "value_text": format_value(m, r.value),
+                 "runner_up": None if pd.isna(r.runner_up) else r.runner_up,
+                 "advantage": None if np.isnan(r.advantage) else float(r.advantage),
+                 "advantage_text": format_advantage(m, r.advantage)}
+                for r in g.itertuples() for m in [dict(CATEGORIES)[r.category]]]
+        return len(self._champions)
+
+
+def growth_matrix(d):
+    """rev YoY % (analytics.py) as a company × year array aligned with d.cube."""
+    t = analytics.for_dataset(d).pivot("rev_yoy")
+    t = t.reindex(index=[int(y) for y in d.cube.years], columns=list(d.cube.companies))
+    return t.to_numpy(dtype=float).T
+
+
+# ── PER-DATASET CACHE ──────────────────────────────────────────────────────────
+_rankings = VersionCache()
+
+def for_dataset(d):
+    """The Rankings of `d`, built once per dataset version (seeded from STORE if current)."""
+    def build():
+        r = Rankings(d.cube, growth_matrix(d), d.version)
+        r.load()
+        return r
+    return _rankings.get(d.version, build)
+
+
+if __name__ == "__main__":
+    import data_store
+    d = data_store.load_dataset()
+    r = for_dataset(d)
+    n = r.materialize()
+    path = r.save(sys.argv[1] if len(sys.argv) > 1 else STORE)
+    print(f"{n} (year, subset) entries, {len(r.table())} rows → {path}")
+    for ch in r.champions(r.companies):
+        print(f"{ch['category']:<24} {ch['winner']:<18} {ch['value_text']:<16} "
+              f"{ch['runner_up'] or '—':<18} {ch['advantage_text']}")
@@ -0,0 +1,180 @@
+"""
+DA-AI Scenario Engine
+=========================================================
+Vectorized Monte Carlo projections of ARR and gross margin, 2026–2030.
+
+Model, per company (all paths and years in one batched array operation):
+
+    ARR     log ARR_t = log ARR_2025 + Σ g_s
+            g_t       = g∞ + (g_2025 - g∞) φ^t + ε_t,   ε_t ~ N(0, (σ φ^t)²)
+    margin  gap_t     = cap - margin_t
+            gap_t     = ψ gap_{t-1} + η_t,               η_t ~ N(0, τ²)
+
+Fitted from history (cube built from fin/usr):
+    g_2025  last observed ARR log-growth
+    σ       robust (MAD) scale of year-over-year changes in ARR and MAU
+            log-growth, pooled across companies; each series' launch-year
+            growth is left out since it measures the launch, not volatility
+    ψ, τ    margin convergence rate toward `cap` and residual scale
+
+φ is the one calibrated term: it is solved per company so the median path
+lands on that company's base-case 2030 projection, falling back to the
+median φ for companies without one. Growth shocks are transient and their
+scale decays with φ^t, because excess growth and its noise both fade as
+companies scale.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from data_store import VersionCache
+
+YEARS       = np.arange(2026, 2031)
+PERCENTILES = (5, 25, 50, 75, 95)
+N_PATHS     = 50_000       # paths per company in a small universe
+PATH_BUDGET = 100_000      # company × path cap of one fan, so cold builds stay interactive
+MIN_PATHS   = 2_000        # floor per company, so the p5/p95 tails keep ~100 paths each
+
+Fan = namedtuple("Fan", "companies years percentiles arr margin params")
+
+
+# ── FITTING ────────────────────────────────────────────────────────────────────
+def _log_growth(cube, measure, company, last_year):
+    yrs, v = cube.present(measure, company)
+    v = v[(yrs <= last_year) & (v > 0)]
+    return np.diff(np.log(v))
+
+
+def _mad(x):
+    x = np.asarray(x, dtype=float)
+    return 1.4826 * np.median(np.abs(x - np.median(x))) if len(x) else np.nan
+
+
+def _solve_phi(excess, target, horizon, lo=0.0, hi=0.95, iters=60):
+    """Vectorized bisection for φ in Σ_{t=1..H} φ^t · excess = target."""
+    lo, hi = np.full_like(excess, lo), np.full_like(excess, hi)
+    t = np.arange(1, horizon + 1)
+    for _ in range(iters):
+        mid = (lo + hi) / 2
+        f = (mid[:, None] ** t).sum(axis=1) * excess - target
+        lo, hi = np.where(f < 0, mid, lo), np.where(f < 0, hi, mid)
+    return (lo + hi) / 2
+
+
+def fit(cube, last_year=2025, terminal=0.25, cap=85.0, years=YEARS):
+    """Per-company parameters as arrays aligned with cube.companies."""
+    cos = list(cube.companies)
+    horizon = int(years[-1] - last_year)
+
+    arr0, g0 = np.zeros(len(cos)), np.full(len(cos), terminal)
+    for i, c in enumerate(cos):
+        yrs, v = cube.present("arr", c)
+        v = v[yrs <= last_year]
+        arr0[i] = v[-1] if len(v) else 0.0
+        g = _log_growth(cube, "arr", c, last_year)
+        if len(g):
+            g0[i] = g[-1]
+
+    changes = [np.diff(_log_growth(cube, m, c, last_year)[1:]) for m in ("arr", "mau") if m in cube.measures for c in cos]
+    changes = np.concatenate(changes) if changes else np.array([])
+    sigma = _mad(changes) if len(changes) >= 3 else 0.5
+
+    has_base = "base" in cube.measures and int(years[-1]) in cube.years
+    base = cube.at_year("base", int(years[-1])) if has_base else np.full(len(cos), np.nan)
+    ok = np.isfinite(base) & (arr0 > 0)
+    target = np.where(ok, np.log(np.where(ok, base, 1) / np.where(arr0 > 0, arr0, 1)), 0) - horizon * terminal
+    excess = g0 - terminal
+    phi = np.full(len(cos), np.nan)
+    solvable = ok & (excess > 0) & (target > 0)
+    phi[solvable] = _solve_phi(excess[solvable], target[solvable], horizon)
+    phi[ok & ~solvable] = 0.0
+    phi[~ok] = np.nanmedian(phi) if np.isfinite(phi).any() else 0.5
+
+    m0, psi, gaps = np.zeros(len(cos)), np.zeros(len(cos)), []
+    for i, c in enumerate(cos):
+        yrs, m = cube.present("margin", c)
+        m = m[yrs <= last_year]
+        m0[i] = m[-1] if len(m) else cap / 2
+        gap = cap - m
+        if len(gap) >= 2 and (gap[:-1] > 0).all():
+            ratio = gap[1:] / gap[:-1]
+            psi[i] = np.clip(np.median(ratio), 0.3, 1.0)
+            gaps.append(gap[1:] - psi[i] * gap[:-1])
+        else:
+            psi[i] = np.nan
+    psi = np.where(np.isfinite(psi), psi, np.nanmedian(psi) if np.isfinite(psi).any() else 0.8)
+    tau = _mad(np.concatenate(gaps)) if gaps else 3.0
+
+    return dict(companies=cos, arr0=arr0, g0=g0, terminal=terminal, sigma=sigma, phi=phi,
+                margin0=m0, cap=cap, psi=psi, tau=tau if np.isfinite(tau) else 3.0)
+
+
+# ── SIMULATION ─────────────────────────────────────────────────────────────────
+def paths_for(n_companies):
+    """Paths per company for a fan over `n_companies`, within PATH_BUDGET."""
+    return int(min(N_PATHS, max(MIN_PATHS, PATH_BUDGET // max(n_companies, 1))))
+
+
+def _ar1_weights(rho, horizon):
+    """W[c, t, k] = ρ_c^(t-k) for k ≤ t, so (W @ shocks) is the AR(1) response."""
+    t = np.arange(horizon)
+    lag = t[:, None] - t[None, :]
+    return np.where(lag >= 0, rho[:, None, None] ** np.maximum(lag, 0), 0.0)
+
+
+def simulate(cube, n_paths=N_PATHS, years=YEARS, seed=0, percentiles=PERCENTILES,
+             max_cells=1_000_000, **fit_kw):
+    """Percentile fan bands for every company: arrays of shape (company, pct, year).
+
+    Companies are simulated in blocks of at most `max_cells` path-years so a
+    500-vendor universe does not allocate every path at once.
+    """
+    p = fit(cube, years=years, **fit_kw)
+    C, H = len(p["companies"]), len(years)
+    rng = np.random.default_rng(seed)
+    t = np.arange(1, H + 1)
+    q = np.asarray(percentiles, dtype=float)
+    arr_q, margin_q = np.empty((C, len(q), H)), np.empty((C, len(q), H))
+
+    block = max(1, max_cells // (n_paths * H))
+    for s in range(0, C, block):
+        c = slice(s, min(C, s + block))
+        n = c.stop - c.start
+
+        # Paths are laid out (company, year, path) so the percentile sorts run over
+        # contiguous memory, and stay float32 (only per-company terms are float64).
+        # ARR: deterministic growth decay plus transient shocks with φ^t-scaled volatility.
+        phi = p["phi"][c, None]
+        drift = p["terminal"] + (p["g0"][c] - p["terminal"])[:, None] * phi ** t           # (n, H)
+        scale = (p["sigma"] * phi ** t).astype(np.float32)
+        eps = rng.standard_normal((n, H, n_paths), dtype=np.float32) * scale[:, :, None]
+        eps += drift.astype(np.float32)[:, :, None]
+        arr = np.exp(np.cumsum(eps, axis=1)) * p["arr0"][c, None, None].astype(np.float32)
+
+        # Margin: gap to the cap shrinks by ψ per year, with AR(1) noise; clipped to [0, 95].
+        gap0 = ((p["cap"] - p["margin0"][c])[:, None] * p["psi"][c, None] ** t).astype(np.float32)
+        eta = rng.standard_normal((n, H, n_paths), dtype=np.float32) * np.float32(p["tau"])
+        noise = _ar1_weights(p["psi"][c], H).astype(np.float32) @ eta
+        margin = np.clip(p["cap"] - gap0[:, :, None] - noise, 0, 95)
+
+        arr_q[c] = np.percentile(arr, q, axis=2).transpose(1, 0, 2)
+        margin_q[c] = np.percentile(margin, q, axis=2).transpose(1, 0, 2)
+
+    return Fan(p["companies"], np.asarray(years), q, arr_q, margin_q, p)
+
+
+_FANS = VersionCache(keep=2)
+
+def fan_for(d, n_paths=None, seed=0):
+    """simulate() memoized per dataset version, so every builder shares one run.
+
+    n_paths defaults to paths_for() the dataset's company count.
+    """
+    n_paths = n_paths or paths_for(len(d.cube.companies))
+    return _FANS.get((d.version, n_paths, seed), lambda: simulate(d.cube, n_paths=n_paths, seed=seed))
+
+def prime(d, fan, n_paths=None, seed=0):
+    """Install a precomputed fan for `d` (snapshot.py)."""
+    n_paths = n_paths or paths_for(len(d.cube.companies))
+    return _FANS.put((d.version, n_paths, seed), fan)
@@ -0,0 +1,157 @@
+"""
+DA-AI Shared Store
+=========================================================
+One read-only Dataset per process, hot-swapped when the source files change.
+
+    store = SharedStore().start()       # loads once, then polls in the background
+    d = store.current()                 # the live snapshot (no copy)
+
+Every session reads the same frames and cube; nothing is pickled or copied
+per session, and the cube's array is flagged read-only so a stray write
+fails loudly instead of leaking into other sessions.
+
+A daemon thread polls the (mtime, size) of Master_AI_Economics_Data.xlsx and
+data/*.csv. A change is only acted on once it has been stable for one poll
+(editors write in bursts); the new Dataset is then built off to the side and
+published with a single reference swap. Readers holding the old snapshot
+keep it intact until they let go of it, and a failed load (half-written
+file) leaves the current snapshot in place and retries on the next poll.
+If the very first load fails there is no snapshot to keep, so the store
+starts from the seed and workbook layers alone (fallback_dataset()) and
+reports the error in last_error until a later load succeeds.
+create_store() adds the live REST/SQL sources of live_sources.json
+(connectors.py) on top, republishing whenever a refresh changes them.
+"""
+
+import threading
+import time
+
+import data_store
+
+
+def watched_paths():
+    return [data_store.WORKBOOK, *sorted(data_store.DATA_DIR.glob("*.csv"))]
+
+
+def signature(paths):
+    """(path, mtime_ns, size) for every watched file that exists."""
+    out = []
+    for p in paths:
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        out.append((str(p), st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+def _freeze(d):
+    d.cube.values.flags.writeable = False
+    if data_store.SNAPSHOT.exists():    # derived caches precomputed by snapshot.py
+        import snapshot
+        snapshot.attach(d)
+    return d
+
+
+def fallback_dataset():
+    """The seed and workbook layers without data/*.csv; the seed alone if the workbook fails too."""
+    try:
+        return data_store.load_dataset(data_dir=None)
+    except Exception:
+        return data_store.load_dataset(path=None, data_dir=None)
+
+
+class SharedStore:
+    def __init__(self, load=data_store.load_dataset, paths=watched_paths, interval=2.0,
+                 fallback=fallback_dataset):
+        self._load, self._paths, self.interval = load, paths, interval
+        self._lock    = threading.Lock()
+        self._stop    = threading.Event()
+        self._thread  = None
+        self._sig     = signature(self._paths())
+        self._pending = None
+        self.last_error = None
+        try:
+            d = self._load()
+        except Exception as e:          # nothing to keep serving yet: start from the fallback
+            self.last_error = f"{type(e).__name__}: {e}"
+            d = fallback()
+        self._current = _freeze(d)
+        self.generation = 1
+        self.loaded_at  = time.time()
+        self.feed = None
+
+    def current(self):
+        return self._current
+
+    def check(self):
+        """One poll; returns True if a new snapshot was published."""
+        sig = signature(self._paths())
+        if sig == self._sig:
+            self._pending = None
+            return False
+        if sig != self._pending:        # still changing: wait for it to settle
+            self._pending = sig
+            return False
+        return self.reload(sig)
+
+    def reload(self, sig=None):
+        with self._lock:
+            sig = sig or signature(self._paths())
+            try:
+                d = _freeze(self._load())
+            except Exception as e:      # keep serving the last good snapshot
+                self.last_error = f"{type(e).__name__}: {e}"
+                return False
+            self._sig, self._pending, self.last_error = sig, None, None
+            if d.version == self._current.version:
+                return False
+            self._current = d
+            self.generation += 1
+            self.loaded_at = time.time()
+            return True
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="shared-store-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stats(self):
+        out = {"version": self._current.version, "generation": self.generation,
+               "loaded_at": time.strftime("%H:%M:%S", time.localtime(self.loaded_at)),
+               "watching": len(self._sig), "last_error": self.last_error}
+        if self.feed is not None:
+            out["live_sources"] = len(self.feed.sources)
+            out["live_errors"] = len(self.feed.errors)
+        return out
+
+
+def create_store():
+    """A started SharedStore, fed by live_sources.json's connectors when present."""
+    if not data_store.LIVE_SOURCES.exists():
+        return SharedStore().start()
+    import connectors               # asyncio, http.client, sqlite3: only with a config
+    feed = connectors.from_config()
+    store = SharedStore(load=feed.load_dataset).start()
+    store.feed = feed.start(store)
+    return store
+
+
+_default = None
+_default_lock = threading.Lock()
+
+def default():
+    """Process-wide store for callers outside Streamlit (api_server.py)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = create_store()
+    return _default
@@ -0,0 +1,344 @@
+"""
+DA-AI Aggregate Snapshot
+=========================================================
+Precompute, once per data refresh, the aggregates both front ends would
+otherwise derive per process or per rerun, into one compressed artifact:
+
+    python snapshot.py                      # → .store/snapshot.arrow + .store/snapshot.json
+    python snapshot.py --workers 4 --force
+
+Groups, each computed independently (in parallel, one worker per core):
+
+    growth          analytics.py derived frame (YoY, CAGR, rolling, burn multiple)
+    rankings        rankings.py champions for every materialized (year, subset)
+    scenarios       scenarios.py Monte Carlo fan bands + fitted parameters
+    figures:<tab>   serialized figures of every chart on that tab, all companies
+    static          api_server.static_dashboard(), also written to dashboard.json
+                    next to index.html for API-less (static) hosting
+
+The snapshot is a single Arrow IPC file with one row per table: its group,
+row count, SHA-256 and the table itself as a zstd-compressed Arrow stream.
+The manifest (dataset version, per-group input keys, per-table checksums)
+rides in the file's schema metadata and is mirrored to snapshot.json.
+
+A group's key hashes its input frames, the company list and the source of
+the modules that compute it. Groups whose key matches the previous snapshot
+are copied over without recomputing, so a tools-only edit rebuilds just the
+models figures.
+
+At load time shared_store calls attach(d): when the snapshot was built from
+the same dataset version and every checksum holds, the derived caches
+(analytics / rankings / scenarios .for_dataset) are primed from it, and the
+Streamlit app primes its FigureCache with the stored figures.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly
+import pyarrow as pa
+
+import analytics
+import api_server
+import charts
+import data_store
+import rankings
+import scenarios
+from data_store import SNAPSHOT
+
+FORMAT = 1
+THEME = "dark"
+CUBE_FRAMES = ("fin", "usr", "ue", "proj")
+
+# group → (input frames, modules whose source it depends on)
+GROUPS = {
+    "growth":    (("fin", "usr"), ("analytics",)),
+    "rankings":  (("fin", "usr", "ue"), ("rankings", "analytics")),
+    "scenarios": (("fin", "usr", "proj"), ("scenarios",)),
+    "static":    (CUBE_FRAMES, ("api_server", "rankings", "analytics", "charts")),
+}
+FIGURE_INPUTS = {
+    "overview":      ("fin", "usr"),
+    "revenue":       ("fin", "usr"),
+    "profitability": ("fin", "ue"),
+    "models":        ("tools",),
+    "growth":        ("fin", "usr", "proj"),
+    "rankings":      ("fin", "usr", "ue"),
+}
+FIGURE_CODE = ("charts", "analytics", "rankings", "scenarios", "tool_index", "downsample")
+for _tab in charts.TABS:
+    GROUPS[f"figures:{_tab}"] = (FIGURE_INPUTS.get(_tab, CUBE_FRAMES + ("tools",)), FIGURE_CODE)
+
+
+# ── AGGREGATES ─────────────────────────────────────────────────────────────────
+def _fan_tables(fan):
+    C, P, H = fan.arr.shape
+    bands = pd.DataFrame({
+        "company":    np.repeat(fan.companies, P * H),
+        "percentile": np.tile(np.repeat(fan.percentiles, H), C),
+        "year":       np.tile(fan.years, C * P),
+        "arr":        fan.arr.ravel(),
+        "margin":     fan.margin.ravel(),
+    })
+    params = pd.DataFrame({k: (v if np.ndim(v) else np.full(C, v))
+                           for k, v in fan.params.items() if k != "companies"})
+    params.insert(0, "company", fan.companies)
+    return {"fan": bands, "fan_params": params}
+
+def _fan(bands, params):
+    companies = list(params["company"])
+    pct, years = np.unique(bands["percentile"]), np.unique(bands["year"])
+    shape = (len(companies), len(pct), len(years))
+    p = {"companies": companies}
+    for k in params.columns[1:]:
+        v = params[k].to_numpy()
+        p[k] = v if k in ("arr0", "g0", "phi", "margin0", "psi") else v[0].item()
+    return scenarios.Fan(companies, years, pct, bands["arr"].to_numpy().reshape(shape),
+                         bands["margin"].to_numpy().reshape(shape), p)
+
+
+def compute(group, d):
+    """{table name: DataFrame} for one group."""
+    if group == "growth":
+        return {"growth": analytics.for_dataset(d).frame}
+    if group == "rankings":
+        r = rankings.for_dataset(d)
+        r.materialize()
+        return {"rankings": r.table()}
+    if group == "scenarios":
+        return _fan_tables(scenarios.fan_for(d))
+    if group == "static":
+        body = json.dumps(api_server.static_dashboard(d), separators=(",", ":"))
+        return {"static": pd.DataFrame({"json": [body]})}
+    tab = group.split(":", 1)[1]
+    cos = tuple(charts.COMPANIES)
+    return {group: pd.DataFrame({"chart": [b.__name__ for b in charts.TABS[tab]],
+                                 "json": [b(d, cos, THEME).to_json() for b in charts.TABS[tab]]})}
+
+
+# ── KEYS ───────────────────────────────────────────────────────────────────────
+def frame_hash(df):
+    h = hashlib.sha256(repr([(c, str(t)) for c, t in df.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+def _source_hash(module):
+    return hashlib.sha256(Path(sys.modules[module].__file__).read_bytes()).hexdigest()
+
+def group_keys(d):
+    """group → hex key over its inputs, the company order and its code."""
+    frames = {name: frame_hash(getattr(d, name)) for name in CUBE_FRAMES + ("tools",)}
+    keys = {}
+    for group, (inputs, code) in GROUPS.items():
+        h = hashlib.sha256(f"{FORMAT}:{group}:{plotly.__version__}".encode())
+        h.update(repr(d.cube.companies).encode())
+        for name in inputs:
+            h.update(frames[name].encode())
+        for module in code:
+            h.update(_source_hash(module).encode())
+        keys[group] = h.hexdigest()[:16]
+    return keys
+
+
+# ── ENCODING ───────────────────────────────────────────────────────────────────
+def encode(df):
+    t = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, t.schema, options=pa.ipc.IpcWriteOptions(compression="zstd")) as w:
+        w.write_table(t)
+    return sink.getvalue().to_pybytes()
+
+def decode(blob):
+    return pa.ipc.open_stream(blob).read_all().to_pandas()
+
+
+def write(path, manifest, rows):
+    """rows: [(table, group, sha256, n_rows, blob)] → one Arrow IPC file + JSON manifest."""
+    t = pa.table({"table":  [r[0] for r in rows], "group": [r[1] for r in rows],
+                  "sha256": [r[2] for r in rows], "rows": pa.array([r[3] for r in rows], pa.int64()),
+                  "data":   pa.array([r[4] for r in rows], pa.large_binary())})
+    t = t.replace_schema_metadata({b"manifest": json.dumps(manifest).encode()})
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, t.schema) as w:
+        w.write_table(t)
+    os.replace(tmp, path)
+    path.with_suffix(".json").write_text(json.dumps(manifest, indent=2))
+
+
+class Snapshot:
+    def __init__(self, manifest, rows):
+        self.manifest = manifest
+        self.version = manifest["dataset"]
+        self.rows = rows            # table → (group, sha256, n_rows, blob)
+
+    def table(self, name):
+        return decode(self.rows[name][3])
+
+    def group(self, group):
+        return {name: self.table(name) for name, r in self.rows.items() if r[0] == group}
+
+
+_read = {}
+
+def read(path=SNAPSHOT):
+    """The Snapshot at `path` with every checksum verified, or None if absent,
+    unreadable or corrupt. Memoized on the file's mtime."""
+    path = Path(path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    hit = _read.get(str(path))
+    if hit and hit[0] == mtime:
+        return hit[1]
+    try:
+        with pa.memory_map(str(path), "r") as src:
+            t = pa.ipc.open_file(src).read_all()
+        manifest = json.loads(t.schema.metadata[b"manifest"])
+        rows = {name: (group, sha, n, blob) for name, group, sha, n, blob in
+                zip(*(t[c].to_pylist() for c in ("table", "group", "sha256", "rows", "data")))}
+    except (OSError, KeyError, ValueError, pa.ArrowInvalid):
+        return None
+    if manifest.get("format") != FORMAT or any(
+            hashlib.sha256(blob).hexdigest() != sha for _, sha, _, blob in rows.values()):
+        return None
+    snap = Snapshot(manifest, rows)
+    _read[str(path)] = (mtime, snap)
+    return snap
+
+
+# ── FRONT ENDS ─────────────────────────────────────────────────────────────────
+_attached = set()
+_lock = threading.Lock()
+
+def _once(key):
+    with _lock:
+        if key in _attached:
+            return False
+        _attached.add(key)
+        return True
+
+def attach(d, cache=None, path=SNAPSHOT):
+    """Prime the derived caches of `d` (and `cache` with the stored figures)
+    from the snapshot if it was built from d.version. Returns the groups primed."""
+    snap = read(path)
+    if snap is None or snap.version != d.version:
+        return []
+    primed, groups = [], {r[0] for r in snap.rows.values()}
+    if _once((d.version, str(path))):
+        if "growth" in groups:
+            analytics.prime(d, analytics.Analytics(snap.table("growth"), derived=True))
+            primed.append("growth")
+        if "rankings" in groups:
+            rankings.for_dataset(d).seed(snap.table("rankings"))
+            primed.append("rankings")
+        if "scenarios" in groups:
+            scenarios.prime(d, _fan(snap.table("fan"), snap.table("fan_params")),
+                            snap.manifest["n_paths"], snap.manifest["seed"])
+            primed.append("scenarios")
+    if cache is not None and _once((d.version, str(path), id(cache))):
+        cos = tuple(charts.COMPANIES)
+        for group in sorted(g for g in groups if g.startswith("figures:")):
+            for chart, js in snap.table(group).itertuples(index=False):
+                cache.put((d.version, chart, cos, THEME), js)
+            primed.append(group)
+    return primed
+
+
+# ── PIPELINE ───────────────────────────────────────────────────────────────────
+_worker = {}
+
+def _init_worker():
+    _worker["data"] = data_store.load_dataset()
+
+def _build(group):
+    d = _worker["data"]
+    t0 = time.perf_counter()
+    tables = {name: encode(df) for name, df in compute(group, d).items()}
+    return group, d.version, tables, round((time.perf_counter() - t0) * 1000, 1)
+
+
+def build(path=SNAPSHOT, workers=None, force=False):
+    """Recompute changed groups (in parallel) and write the snapshot; returns the manifest."""
+    t0 = time.perf_counter()
+    d = data_store.load_dataset()
+    keys = group_keys(d)
+    prev = None if force else read(path)
+    prev_keys = prev.manifest["groups"] if prev else {}
+    reuse = [g for g in GROUPS if prev_keys.get(g, {}).get("key") == keys[g]]
+    todo = [g for g in GROUPS if g not in reuse]
+
+    rows, timings = [], {}
+    for name, (group, sha, n, blob) in (prev.rows.items() if prev else ()):
+        if group in reuse:
+            rows.append((name, group, sha, n, blob))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(todo) or 1))
+    if todo:
+        with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+            for fut in as_completed([pool.submit(_build, g) for g in todo]):
+                group, version, tables, ms = fut.result()
+                if version != d.version:
+                    raise RuntimeError(f"data changed during the build ({d.version} → {version}); rerun")
+                timings[group] = ms
+                for name, blob in tables.items():
+                    n = pa.ipc.open_stream(blob).read_all().num_rows
+                    rows.append((name, group, hashlib.sha256(blob).hexdigest(), n, blob))
+    order = list(GROUPS)
+    rows.sort(key=lambda r: (order.index(r[1]), r[0]))
+
+    manifest = {
+        "format":  FORMAT,
+        "dataset": d.version,
+        "snapshot": hashlib.sha256("".join(r[2] for r in rows).encode()).hexdigest()[:12],
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "n_paths": scenarios.paths_for(len(d.cube.companies)), "seed": 0, "theme": THEME,
+        "groups":  {g: {"key": keys[g], "inputs": list(GROUPS[g][0]), "built": g in todo,
+                        "ms": timings.get(g)} for g in GROUPS},
+        "tables":  {r[0]: {"group": r[1], "sha256": r[2], "rows": r[3], "bytes": len(r[4])} for r in rows},
+        "workers": workers if todo else 0,
+        "wall_s":  round(time.perf_counter() - t0, 2),
+    }
+    write(path, manifest, rows)
+    write_static(next(r[4] for r in rows if r[0] == "static"))
+    return manifest
+
+
+def write_static(blob, path=api_server.STATIC):
+    """dashboard.json from the static table, rewritten only when it changed."""
+    body = decode(blob)["json"].iloc[0]
+    path = Path(path)
+    if not path.exists() or path.read_text() != body:
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp.write_text(body)
+        os.replace(tmp, path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--out", default=str(SNAPSHOT))
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--force", action="store_true", help="rebuild every group, even unchanged ones")
+    args = ap.parse_args(argv)
+    m = build(args.out, args.workers, args.force)
+    for g, info in m["groups"].items():
+        print(f"  {g:<24} {'built' if info['built'] else 'reused':<7} {info['ms'] or '':>9}")
+    size = sum(t["bytes"] for t in m["tables"].values())
+    built = sum(g["built"] for g in m["groups"].values())
+    print(f"snapshot {m['snapshot']} of {m['dataset']}: {built}/{len(m['groups'])} groups built, "
+          f"{len(m['tables'])} tables, {size / 1024:.0f} KB, {m['wall_s']}s → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""connectors.py against local stand-ins: a threaded HTTP fixture and SQLite."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import pytest
+
+import connectors
+from connectors import HttpSource, LiveFeed, SqliteSource, _Pool
+
+COMPANIES = ["OpenAI", "Anthropic", "Google (Gemini)", "Meta (Llama)", "xAI (Grok)"]
+ARR = {c: 10.0 + i for i, c in enumerate(COMPANIES)}
+DELAY = 0.3
+
+
+# ── FIXTURES ───────────────────────────────────────────────────────────────────
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # keep-alive, so the pool reuses connections
+    hits = {}
+
+    def do_GET(self):
+        kind, company = self.path.strip("/").split("/")[:2]
+        company = unquote(company)
+        n = Handler.hits[kind, company] = Handler.hits.get((kind, company), 0) + 1
+        if kind == "slow":
+            time.sleep(DELAY)
+        if kind == "flaky" and n == 1:
+            return self._send(503, {"error": "warming up"})
+        if kind == "missing":
+            return self._send(404, {"error": "no such company"})
+        self._send(200, {"rows": [{"company": company, "year": 2025, "ARR (Billions USD)": ARR[company]}]})
+
+    def _send(self, status, obj):
+        body = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api():
+    Handler.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    path = tmp_path / "warehouse.db"
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE users (company TEXT, year INT, monthly_active_users_millions REAL)")
+        db.executemany("INSERT INTO users VALUES (?, ?, ?)",
+                       [(c, y, 100.0 * (i + 1) + y - 2024) for i, c in enumerate(COMPANIES) for y in (2024, 2025)])
+    return str(path)
+
+
+def http_source(api, kind="metrics", **kw):
+    return HttpSource(kind, "fin", api, f"/{kind}/{{company}}", **kw)
+
+
+# ── HTTP ───────────────────────────────────────────────────────────────────────
+def test_http_rows_reach_fin(api):
+    feed = LiveFeed([http_source(api)], COMPANIES)
+    assert asyncio.run(feed.refresh())
+    fin = feed.frames["fin"].set_index("company")
+    assert not feed.errors
+    assert {c: fin.loc[c, "arr"] for c in COMPANIES} == pytest.approx(ARR)
+    assert not asyncio.run(feed.refresh())          # same data: nothing to publish
+    feed.stop()
+
+
+def test_companies_are_fetched_concurrently(api):
+    src = http_source(api, "slow", timeout=5.0)
+    feed = LiveFeed([src], COMPANIES)
+    t0 = time.perf_counter()
+    asyncio.run(feed.refresh())
+    assert not feed.errors
+    assert time.perf_counter() - t0 < DELAY * len(COMPANIES) / 2
+    feed.stop()
+
+
+def test_pool_reuses_connections(api):
+    src = http_source(api, pool=2)
+    feed = LiveFeed([src], COMPANIES)
+    for _ in range(3):
+        asyncio.run(feed.refresh())
+    assert src.pool.opened <= 2
+    feed.stop()
+
+
+def test_retries_5xx_with_backoff(api):
+    src = http_source(api, "flaky", retries=2, backoff=0.01)
+    feed = LiveFeed([src], COMPANIES)
+    asyncio.run(feed.refresh())
+    assert not feed.errors
+    assert all(Handler.hits["flaky", c] == 2 for c in COMPANIES)
+    feed.stop()
+
+
+def test_4xx_fails_without_retry(api):
+    src = http_source(api, "missing", retries=3, backoff=0.01)
+    feed = LiveFeed([src], COMPANIES[:1])
+    asyncio.run(feed.refresh())
+    assert "HTTP 404" in feed.errors["missing", "OpenAI"]
+    assert Handler.hits["missing", "OpenAI"] == 1
+    feed.stop()
+
+
+def test_timeout_keeps_last_good_rows(api):
+    src = http_source(api, "slow", timeout=5.0)
+    feed = LiveFeed([src], COMPANIES[:1])
+    asyncio.run(feed.refresh())
+    src.timeout, src.retries = DELAY / 3, 0
+    asyncio.run(feed.refresh())
+    assert "TimeoutError" in feed.errors["slow", "OpenAI"]
+    assert feed.frames["fin"].set_index("company").loc["OpenAI", "arr"] == pytest.approx(ARR["OpenAI"])
+    feed.stop()
+
+
+# ── POOL ───────────────────────────────────────────────────────────────────────
+class FakeConn:
+    def __init__(self):
+        self.in_use = threading.Event()
+        self.closed_while_in_use = False
+        self.closes = 0
+
+    def work(self, seconds):
+        self.in_use.set()
+        time.sleep(seconds)
+        self.in_use.clear()
+        return "done"
+
+    def close(self):
+        self.closed_while_in_use |= self.in_use.is_set()
+        self.closes += 1
+
+
+def test_timed_out_connection_is_closed_by_its_worker():
+    conn = FakeConn()
+    pool = _Pool(lambda: conn, 1)
+
+    async def go():
+        with pytest.raises(TimeoutError):
+            await pool.run(lambda c: c.work(0.2), timeout=0.05)
+        assert conn.closes == 0                     # the worker still holds it
+        await asyncio.sleep(0.3)
+
+    asyncio.run(go())
+    assert conn.closes == 1 and not conn.closed_while_in_use
+    assert not pool._idle                           # never handed out again
+
+
+def test_failed_call_closes_connection_once():
+    conn = FakeConn()
+    pool = _Pool(lambda: conn, 1)
+
+    def boom(c):
+        raise ValueError("bad query")
+
+    with pytest.raises(ValueError):
+        asyncio.run(pool.run(boom, timeout=1))
+    assert conn.closes == 1 and not pool._idle
+
+
+# ── SQLITE ─────────────────────────────────────────────────────────────────────
+def test_sqlite_rows_reach_usr(warehouse):
+    src = SqliteSource("warehouse", "usr", warehouse,
+                       "SELECT year, monthly_active_users_millions FROM users WHERE company = ?")
+    feed = LiveFeed([src], COMPANIES)
+    asyncio.run(feed.refresh())
+    usr = feed.frames["usr"]
+    assert not feed.errors
+    assert len(usr) == 2 * len(COMPANIES)
+    row = usr[(usr.company == "Anthropic") & (usr.year == 2025)]
+    assert float(row["mau"].iloc[0]) == pytest.approx(201.0)
+    feed.stop()
+
+
+def test_sqlite_bad_query_is_reported(warehouse):
+    src = SqliteSource("warehouse", "usr", warehouse, "SELECT * FROM nope WHERE company = ?",
+                       retries=0)
+    feed = LiveFeed([src], COMPANIES[:1])
+    asyncio.run(feed.refresh())
+    assert "OperationalError" in feed.errors["warehouse", "OpenAI"]
+    feed.stop()
+
+
+def test_live_frames_layer_over_the_dataset(api, warehouse):
+    feed = LiveFeed([http_source(api),
+                     SqliteSource("warehouse", "usr", warehouse,
+                                  "SELECT year, monthly_active_users_millions FROM users WHERE company = ?")],
+                    COMPANIES)
+    asyncio.run(feed.refresh())
+    d = feed.load_dataset()
+    assert d.cube.value("arr", "Anthropic", 2025) == pytest.approx(ARR["Anthropic"])
+    assert d.cube.value("mau", "OpenAI", 2025) == pytest.approx(101.0)
+    feed.stop()
+
+
+def test_from_config(tmp_path, api, warehouse):
+    cfg = tmp_path / "live_sources.json"
+    cfg.write_text(json.dumps({"interval": 60, "companies": COMPANIES[:2], "sources": [
+        {"type": "http", "name": "finance-api", "frame": "fin", "base_url": api,
+         "path": "/metrics/{company}"},
+        {"type": "sqlite", "name": "warehouse", "frame": "usr", "database": warehouse,
+         "query": "SELECT year, monthly_active_users_millions FROM users WHERE company = ?"}]}))
+    feed = connectors.from_config(cfg)
+    assert feed.interval == 60 and [s.name for s in feed.sources] == ["finance-api", "warehouse"]
+    asyncio.run(feed.refresh())
+    assert not feed.errors and set(feed.frames) == {"fin", "usr"}
+    feed.stop()
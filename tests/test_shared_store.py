@@ -0,0 +1,31 @@
+"""shared_store.SharedStore against a temporary data/ directory."""
+
+import data_store
+from shared_store import SharedStore, signature
+
+GOOD = ("company,year,ARR (Billions USD)\n"
+        "Anthropic,2025,12.5\n")
+
+
+def store_for(data_dir):
+    paths = lambda: sorted(data_dir.glob("*.csv"))
+    return SharedStore(load=lambda: data_store.load_dataset(data_dir=data_dir), paths=paths)
+
+
+def test_invalid_csv_at_cold_start_falls_back(tmp_path):
+    (tmp_path / "01_bad.csv").write_text("foo,bar\n1,2\n")
+    store = store_for(tmp_path)
+    assert "SchemaError" in store.last_error
+    assert store.current().version == data_store.load_dataset(data_dir=None).version
+    assert store.stats()["last_error"] == store.last_error
+
+
+def test_fixed_csv_replaces_the_fallback(tmp_path):
+    bad = tmp_path / "01_bad.csv"
+    bad.write_text("foo,bar\n1,2\n")
+    store = store_for(tmp_path)
+    bad.unlink()
+    (tmp_path / "01_good.csv").write_text(GOOD)
+    assert store.reload(signature(sorted(tmp_path.glob("*.csv"))))
+    assert store.last_error is None
+    assert store.current().cube.value("arr", "Anthropic", 2025) == 12.5
@@ -0,0 +1,135 @@
+"""
+DA-AI Tool Index
+=========================================================
+Ranking engine over the Tool Comparison table (Dataset.tools):
+
+    idx = tool_index.for_dataset(d)
+    idx.query(cat="Coding", k=5)                                  # top 5 coding tools by score
+    idx.query(co=("OpenAI", "Google"), min_scores={"perf": 9})
+    idx.query(weights={"perf": 2, "cost": 1, "ease": 1}, k=10)    # user-weighted composite
+
+Everything a query touches is precomputed once per dataset:
+
+    order[m]                 all tools sorted by metric m (descending, stable)
+    postings[f][v][m]        the tools with facet f == v, sorted by m
+
+A single-metric query walks the smallest matching posting list, which is
+already in rank order, so it only masks that list and slices the first k.
+A weighted query scores the candidates with one matrix-vector product and
+takes the top k with np.argpartition (O(n)) before sorting just those k.
+At 100k tools either path answers in a few milliseconds.
+"""
+
+import numpy as np
+import pandas as pd
+
+from data_store import VersionCache
+from schema import to_float64
+
+FACETS  = ("cat", "co")
+METRICS = ("perf", "cost", "ease", "score")
+WEIGHTED = ("perf", "cost", "ease")
+
+
+class ToolIndex:
+    def __init__(self, tools):
+        self.tools = tools.reset_index(drop=True)
+        n = len(self.tools)
+        self.vals = np.column_stack([to_float64(self.tools[m]) for m in METRICS]) if n else np.empty((0, 4))
+        self.tools[list(METRICS)] = self.vals
+        self.codes, self.labels = {}, {}
+        for f in FACETS:
+            codes, labels = pd.factorize(self.tools[f], sort=True)
+            self.codes[f], self.labels[f] = codes, {v: i for i, v in enumerate(labels)}
+        # by=None keeps table order; NaN metrics sort last.
+        self.order = {None: np.arange(n)}
+        for j, m in enumerate(METRICS):
+            self.order[m] = np.argsort(-np.nan_to_num(self.vals[:, j], nan=-np.inf), kind="stable")
+        self.rank = {m: np.argsort(o, kind="stable") for m, o in self.order.items()}
+        self.postings = {f: {v: {} for v in self.labels[f]} for f in FACETS}
+        for f in FACETS:
+            names = list(self.labels[f])
+            bounds = np.cumsum(np.bincount(self.codes[f], minlength=len(names)))[:-1]
+            for m, o in self.order.items():
+                # A stable sort by facet code groups each value's tools while
+                # keeping them in m-order; split the result per value.
+                grouped = o[np.argsort(self.codes[f][o], kind="stable")]
+                for v, part in zip(names, np.split(grouped, bounds)):
+                    self.postings[f][v][m] = part
+
+    def __len__(self):
+        return len(self.tools)
+
+    def facet_values(self, f):
+        return list(self.labels[f])
+
+    def _posting(self, f, values, by):
+        """Tools whose facet f is any of `values`, in `by` order."""
+        unknown = [v for v in values if v not in self.labels[f]]
+        if unknown:
+            raise KeyError(f"unknown {f}: {', '.join(map(str, unknown))}")
+        if len(values) == 1:
+            return self.postings[f][values[0]][by]
+        merged = np.concatenate([self.postings[f][v][by] for v in values])
+        return merged[np.argsort(self.rank[by][merged], kind="stable")]
+
+    def candidates(self, cat=None, co=None, min_scores=None, by="score"):
+        """Indices of the tools passing every filter, in `by` order."""
+        if by not in self.order:
+            raise KeyError(f"unknown metric {by!r}")
+        facets = {f: [v] if isinstance(v, str) else list(v)
+                  for f, v in (("cat", cat), ("co", co)) if v is not None}
+        if facets:
+            lists = {f: self._posting(f, vs, by) for f, vs in facets.items()}
+            base_f = min(lists, key=lambda f: len(lists[f]))
+            base = lists[base_f]
+        else:
+            base_f, base = None, self.order[by]
+        keep = np.ones(len(base), dtype=bool)
+        for f, vs in facets.items():
+            if f != base_f:
+                keep &= np.isin(self.codes[f][base], [self.labels[f][v] for v in vs])
+        for m, t in (min_scores or {}).items():
+            if m not in METRICS:
+                raise KeyError(f"unknown metric {m!r}")
+            keep &= self.vals[base, METRICS.index(m)] >= t
+        return base if keep.all() else base[keep]
+
+    def query(self, cat=None, co=None, min_scores=None, weights=None, by="score", k=10):
+        """Top-k tools as a DataFrame with `rank` and `composite` columns.
+
+        `weights` ({"perf": w, "cost": w, "ease": w}, normalized to sum 1)
+        ranks by the weighted composite; otherwise tools rank by `by`.
+        k=None returns every match.
+        """
+        if k is not None and k < 1:
+            raise ValueError("k must be at least 1")
+        if weights:
+            w = np.array([float(weights.get(m, 0)) for m in WEIGHTED])
+            if set(weights) - set(WEIGHTED) or (w < 0).any() or w.sum() == 0:
+                raise ValueError(f"weights must be non-negative over {', '.join(WEIGHTED)}")
+            idx = self.candidates(cat, co, min_scores, by=None)
+            sub = self.vals[:, :len(WEIGHTED)]
+            score = (sub if len(idx) == len(self) else sub[idx]) @ (w / w.sum())
+            score = np.nan_to_num(score, nan=-np.inf)
+            if k is not None and k < len(idx):
+                top = np.argpartition(-score, k - 1)[:k]
+            else:
+                top = np.arange(len(idx))
+            top = top[np.lexsort((idx[top], -score[top]))]
+            idx, composite = idx[top], score[top]
+        else:
+            idx = self.candidates(cat, co, min_scores, by)[:k]
+            composite = self.vals[idx, METRICS.index(by or "score")]
+        out = self.tools.iloc[idx].copy()
+        out["composite"] = np.round(composite, 4)
+        out["rank"] = np.arange(1, len(out) + 1)
+        return out
+
+
+# ── PER-DATASET CACHE ──────────────────────────────────────────────────────────
+_indexes = VersionCache()
+
+def for_dataset(d):
+    """The ToolIndex of `d`, built once per dataset version."""
+    return _indexes.get(d.version, lambda: ToolIndex(d.tools))
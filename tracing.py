@@ -0,0 +1,218 @@
+"""
+DA-AI Tracing
+=========================================================
+Opt-in, nestable timing spans for one Streamlit rerun.
+
+    tracing.reset()                         # drop a trace an aborted rerun left behind
+    trace = tracing.begin("rerun")          # start collecting on this thread
+    with tracing.span("load_data"):
+        ...
+    tracing.finish(trace)                   # close + hand to the exporter
+
+span() is a no-op (one ContextVar lookup, shared null context) unless a
+trace was started on the current thread, so instrumented code costs nothing
+when tracing is off.
+
+Enable with DASH_TRACE=1 or ?trace=1 in the app URL. Finished traces are
+exported according to DASH_TRACE_EXPORT:
+
+    jsonl:traces.jsonl                      one JSON object per span
+    otlp:http://localhost:4318/v1/traces    OTLP/HTTP JSON payload
+
+`python tracing.py serve` runs a local collector stand-in that accepts OTLP
+JSON on :4318 and appends every span to traces.jsonl.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import secrets
+import sys
+import time
+import urllib.request
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_NULL = nullcontext()
+_current = contextvars.ContextVar("dash_trace", default=None)
+
+
+class Span:
+    __slots__ = ("name", "start", "end", "depth", "parent", "attrs", "span_id")
+
+    def __init__(self, name, start, depth, parent, attrs):
+        self.name, self.start, self.end = name, start, None
+        self.depth, self.parent, self.attrs = depth, parent, attrs
+        self.span_id = secrets.token_hex(8)
+
+    @property
+    def ms(self):
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+
+class Trace:
+    def __init__(self, name):
+        self.trace_id = secrets.token_hex(16)
+        self.wall0    = time.time()
+        self.t0       = time.perf_counter()
+        self.spans    = []
+        self._stack   = []
+        self.root     = self._open(name, {})
+
+    def _open(self, name, attrs):
+        parent = self._stack[-1] if self._stack else None
+        s = Span(name, time.perf_counter(), len(self._stack), parent and parent.span_id, attrs)
+        self.spans.append(s)
+        self._stack.append(s)
+        return s
+
+    def _close(self, s):
+        s.end = time.perf_counter()
+        while self._stack and self._stack.pop() is not s:
+            pass
+
+    def rows(self):
+        """Spans as plain dicts, offsets in ms from the trace start."""
+        return [{
+            "trace_id": self.trace_id, "span_id": s.span_id, "parent_id": s.parent,
+            "name": s.name, "depth": s.depth,
+            "start_ms": round((s.start - self.t0) * 1000, 3), "ms": round(s.ms, 3),
+            "ts": self.wall0 + (s.start - self.t0), **({"attrs": s.attrs} if s.attrs else {}),
+        } for s in self.spans]
+
+
+class _SpanCtx:
+    __slots__ = ("trace", "name", "attrs", "span")
+
+    def __init__(self, trace, name, attrs):
+        self.trace, self.name, self.attrs = trace, name, attrs
+
+    def __enter__(self):
+        self.span = self.trace._open(self.name, self.attrs)
+        return self.span
+
+    def __exit__(self, *exc):
+        self.trace._close(self.span)
+        return False
+
+
+# ── API ────────────────────────────────────────────────────────────────────────
+def enabled_by_env():
+    return os.environ.get("DASH_TRACE") == "1"
+
+
+def reset():
+    """Detach the current trace without exporting it (one cut short by st.stop())."""
+    _current.set(None)
+
+
+def begin(name="rerun"):
+    trace = Trace(name)
+    _current.set(trace)
+    return trace
+
+
+def active():
+    return _current.get()
+
+
+def span(name, **attrs):
+    trace = _current.get()
+    return _NULL if trace is None else _SpanCtx(trace, name, attrs)
+
+
+def traced(name=None):
+    """Decorator form of span(); the disabled path is one ContextVar lookup."""
+    def wrap(fn):
+        label = name or fn.__name__
+        @functools.wraps(fn)
+        def inner(*a, **kw):
+            trace = _current.get()
+            if trace is None:
+                return fn(*a, **kw)
+            with _SpanCtx(trace, label, {}):
+                return fn(*a, **kw)
+        return inner
+    return wrap
+
+
+def finish(trace, export=None):
+    """Close the root span, detach the trace and export it."""
+    trace._close(trace.root)
+    _current.set(None)
+    target = export if export is not None else os.environ.get("DASH_TRACE_EXPORT", "")
+    if target:
+        try:
+            exporter(target)(trace)
+        except OSError:
+            pass  # a missing collector must never break a rerun
+    return trace
+
+
+# ── EXPORTERS ──────────────────────────────────────────────────────────────────
+def exporter(target):
+    kind, _, where = target.partition(":")
+    if kind == "jsonl":
+        return lambda trace: write_jsonl(trace, where or "traces.jsonl")
+    if kind == "otlp":
+        return lambda trace: post_otlp(trace, where or "http://localhost:4318/v1/traces")
+    raise ValueError(f"unknown trace exporter {target!r}")
+
+
+def write_jsonl(trace, path):
+    with open(path, "a") as f:
+        for row in trace.rows():
+            f.write(json.dumps(row) + "\n")
+
+
+def to_otlp(trace, service="da-ai-dashboard"):
+    """OTLP/JSON ExportTraceServiceRequest for one trace."""
+    def ns(t):
+        return str(int((trace.wall0 + (t - trace.t0)) * 1e9))
+    spans = [{
+        "traceId": trace.trace_id, "spanId": s.span_id,
+        **({"parentSpanId": s.parent} if s.parent else {}),
+        "name": s.name, "kind": 1,
+        "startTimeUnixNano": ns(s.start), "endTimeUnixNano": ns(s.end or s.start),
+        "attributes": [{"key": k, "value": {"stringValue": str(v)}} for k, v in s.attrs.items()],
+    } for s in trace.spans]
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+        "scopeSpans": [{"scope": {"name": "tracing"}, "spans": spans}],
+    }]}
+
+
+def post_otlp(trace, url, timeout=2):
+    req = urllib.request.Request(url, data=json.dumps(to_otlp(trace)).encode(),
+                                 headers={"Content-Type": "application/json"})
+    urllib.request.urlopen(req, timeout=timeout).close()
+
+
+# ── COLLECTOR STAND-IN ─────────────────────────────────────────────────────────
+def serve(port=4318, path="traces.jsonl"):
+    class Collector(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            with open(path, "a") as f:
+                for rs in body.get("resourceSpans", []):
+                    for ss in rs.get("scopeSpans", []):
+                        for s in ss.get("spans", []):
+                            f.write(json.dumps(s) + "\n")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    print(f"collecting OTLP JSON on :{port}/v1/traces → {path}")
+    ThreadingHTTPServer(("127.0.0.1", port), Collector).serve_forever()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["serve"]:
+        serve(*(int(a) if i == 0 else a for i, a in enumerate(sys.argv[2:4])))
+    else:
+        print(__doc__)
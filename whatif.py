@@ -0,0 +1,166 @@
+"""
+DA-AI What-If Engine
+=========================================================
+Incremental recomputation of derived 2025 metrics from adjustable inputs.
+
+DerivedGraph is a small pull-based dependency graph: set() marks only the
+transitive dependents of the changed input dirty, and get() recomputes a
+dirty node (and its dirty deps) on demand. Every node holds one array
+aligned with cube.companies, so a slider move recomputes a handful of
+vectorized columns instead of rerunning everything.
+
+    inputs    arpu  cac  churn  growth          (+ fixed arr, rev, val, margin, burn)
+    derived   ltv        = arpu / churn                 (monthly churn)
+              ltvcac     = ltv / cac
+              net_new    = rev · g / (1 + g)            (revenue added in the year)
+              burn_mult  = observed burn multiple · net_new₀ / net_new
+              val_mult   = val / arr
+              comp_score = index.html calcCompScore() (rankings.composite)
+
+CHART_DEPS lists the nodes each chart reads, so only charts downstream of a
+changed input get a new figure-cache key.
+"""
+
+import hashlib
+from collections import defaultdict
+
+import numpy as np
+
+import rankings
+
+YEAR = 2025
+
+# Charts whose figures depend on what-if nodes → the nodes they read.
+CHART_DEPS = {
+    "ltv_cac":             ("ltvcac",),
+    "efficiency_quadrant": ("arpu", "burn_mult"),
+}
+# What-if nodes written back into the cube for the charts above.
+CUBE_NODES = ("arpu", "ltv", "cac", "ltvcac", "burn_mult")
+# Inputs the dashboard exposes as sliders.
+INPUTS = ("cac", "arpu", "churn", "growth")
+
+
+class DerivedGraph:
+    def __init__(self):
+        self._fn     = {}
+        self._deps   = {}
+        self._users  = defaultdict(set)
+        self._values = {}
+        self._dirty  = set()
+        self.recomputed = []
+        self.base = {}                # node -> value when snapshot_base() ran
+        self.fingerprint_base = {}    # chart -> fingerprint when snapshot_base() ran
+
+    def add_input(self, name, value):
+        self._fn[name], self._deps[name] = None, ()
+        self._values[name] = np.asarray(value, dtype=float)
+        return self
+
+    def add(self, name, deps, fn):
+        self._fn[name], self._deps[name] = fn, tuple(deps)
+        for dep in deps:
+            self._users[dep].add(name)
+        self._dirty.add(name)
+        return self
+
+    def downstream(self, name):
+        seen, stack = set(), [name]
+        while stack:
+            for user in self._users[stack.pop()]:
+                if user not in seen:
+                    seen.add(user)
+                    stack.append(user)
+        return seen
+
+    def set(self, name, value):
+        """Replace an input; returns the derived nodes it invalidated."""
+        value = np.asarray(value, dtype=float)
+        if np.array_equal(value, self._values[name], equal_nan=True):
+            return set()
+        self._values[name] = value
+        hit = self.downstream(name)
+        self._dirty |= hit
+        return hit
+
+    def set_at(self, name, i, v):
+        value = self._values[name].copy()
+        value[i] = v
+        return self.set(name, value)
+
+    def get(self, name):
+        if name in self._dirty:
+            args = [self.get(dep) for dep in self._deps[name]]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self._values[name] = np.asarray(self._fn[name](*args), dtype=float)
+            self._dirty.discard(name)
+            self.recomputed.append(name)
+        return self._values[name]
+
+    def fingerprint(self, names):
+        h = hashlib.blake2b(digest_size=8)
+        for n in names:
+            h.update(np.ascontiguousarray(self.get(n)).tobytes())
+        return h.hexdigest()
+
+    def snapshot_base(self, names, charts):
+        """Record current values of `names` and fingerprints of `charts` as the baseline."""
+        self.base = {name: self.get(name).copy() for name in names}
+        self.fingerprint_base = {chart: self.fingerprint(nodes) for chart, nodes in charts.items()}
+
+
+def build_graph(cube, year=YEAR):
+    """Graph seeded from the cube's `year` column; growth is YoY revenue growth in %."""
+    at = lambda m: cube.at_year(m, year).copy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rev_prev = cube.at_year("rev", year - 1)
+        growth0 = (at("rev") / rev_prev - 1) * 100
+        churn0 = at("arpu") / at("ltv")
+    g = DerivedGraph()
+    for name, value in (("arr", at("arr")), ("rev", at("rev")), ("val", at("val")),
+                        ("margin", at("margin")), ("burn", at("burn")),
+                        ("burn_mult0", at("burn_mult")),
+                        ("arpu", at("arpu")), ("cac", at("cac")), ("churn", churn0),
+                        ("growth", growth0), ("growth0", growth0)):
+        g.add_input(name, value)
+    net_new = lambda rev, growth: rev * (growth / 100) / (1 + growth / 100)
+    g.add("ltv", ("arpu", "churn"), lambda arpu, churn: arpu / churn)
+    g.add("ltvcac", ("ltv", "cac"), lambda ltv, cac: ltv / cac)
+    g.add("net_new0", ("rev", "growth0"), net_new)
+    g.add("net_new", ("rev", "growth"), net_new)
+    g.add("burn_mult", ("burn_mult0", "net_new0", "net_new"), lambda b0, n0, n: b0 * n0 / n)
+    g.add("val_mult", ("val", "arr"), lambda val, arr: val / arr)
+    g.add("comp_score", ("arr", "margin", "growth", "ltvcac", "val_mult"), rankings.composite)
+    for name in list(g._dirty):
+        g.get(name)
+    g.recomputed.clear()
+    return g
+
+
+def dataset_for(d, graph, chart, year=YEAR):
+    """The Dataset `chart` should be built from under the current what-if inputs.
+
+    Charts outside CHART_DEPS get `d` untouched (and keep their cache keys);
+    the others get a cube with the moved what-if cells written into `year`
+    and a version suffixed with a fingerprint of just the nodes they read.
+    """
+    if chart not in CHART_DEPS:
+        return d
+    fp = graph.fingerprint(CHART_DEPS[chart])
+    if fp == graph.fingerprint_base.get(chart):
+        return d
+    cube = type(d.cube)(d.cube.values.copy(), d.cube.measures, d.cube.companies, d.cube.years)
+    for name in CUBE_NODES:
+        # Only cells the inputs actually moved are overwritten, so untouched
+        # companies keep their reported (rounded) figures.
+        new, base = graph.get(name), graph.base[name]
+        moved = ~np.isclose(new, base, equal_nan=True)
+        cube.at_year(name, year)[moved] = new[moved]
+    return d._replace(cube=cube, version=f"{d.version}+wi{fp}")
+
+
+def session_graph(cube, year=YEAR):
+    """build_graph() plus the baseline values dataset_for() compares against."""
+    g = build_graph(cube, year)
+    g.snapshot_base(CUBE_NODES + INPUTS, CHART_DEPS)
+    return g